@@ -72,6 +72,7 @@ class User(AbstractUser):
     create_at = models.DateTimeField(auto_now_add=True)
     social_login = models.CharField(max_length=255, null=True, default=0)
     challenge_streak = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # 추천 피처 갱신 기준
 
     is_superuser = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
@@ -117,6 +118,7 @@ class UserChallengeCategory(models.Model):
     drink = models.BooleanField(default=0)
     transportation = models.BooleanField(default=0)
     etc = models.BooleanField(default=0)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)  # 추천 피처 갱신 기준
 
     class Meta:
         db_table = "UserChallengeCategory"
@@ -25,6 +25,7 @@ from django.utils.decorators import method_decorator
 import requests, os, uuid
 import firebase_admin
 from firebase_admin import credentials, storage
+from sns.service_client import get_client
 
 
 class EmailCheckView(views.APIView):
@@ -372,10 +373,9 @@ class UserRecommendationsView(views.APIView):
     def get(self, request):
         try:
             # FastAPI 서버로 요청 보내기
-            response = requests.post(
-                f"{settings.FASTAPI_URL}/api/accounts/recommendations",
+            response = get_client("recommend").post(
+                "/api/accounts/recommendations",
                 json={"id": request.user.id},
-                timeout=10,
             )
             response.raise_for_status()
 
@@ -0,0 +1,128 @@
+import threading
+import time
+from bisect import bisect_right
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from .models import Badge, UserBadge
+from .serializers import BadgeSerializer
+
+
+class BadgeTable:
+    """
+    뱃지 기준값을 유형별로 정렬해 둔 메모리 테이블
+    - streak(badge_type=1): required_date 기준
+    - point(badge_type=0): required_money 기준
+    정렬된 기준값에 bisect를 사용해 달성한 뱃지를 찾습니다.
+    """
+
+    def __init__(self, badges):
+        streak = sorted(
+            (b for b in badges if b.badge_type == 1 and b.required_date is not None),
+            key=lambda b: b.required_date,
+        )
+        point = sorted(
+            (b for b in badges if b.badge_type == 0 and b.required_money is not None),
+            key=lambda b: b.required_money,
+        )
+        self.streak_badges = streak
+        self.streak_thresholds = [b.required_date for b in streak]
+        self.point_badges = point
+        self.point_thresholds = [b.required_money for b in point]
+
+    @classmethod
+    def load(cls):
+        return cls(list(Badge.objects.all()))
+
+    def earned(self, streak, saving):
+        """연속 달성일 수와 누적 절약 금액으로 달성한 뱃지 목록 반환"""
+        earned = []
+        if streak > 0:
+            earned += self.streak_badges[: bisect_right(self.streak_thresholds, streak)]
+        if saving > 0:
+            earned += self.point_badges[: bisect_right(self.point_thresholds, saving)]
+        return earned
+
+
+# 프로세스 내 뱃지 테이블 캐시
+_cached_table = None
+_cached_version = None
+_cache_lock = threading.Lock()
+
+
+def _shared_version():
+    """
+    BADGE_CACHE_VERSION_KEY 설정 시 공유 캐시(django cache)의 버전 값을 사용해
+    다른 프로세스에서 발생한 뱃지 변경도 감지합니다.
+    """
+    key = getattr(settings, "BADGE_CACHE_VERSION_KEY", None)
+    if not key:
+        return None
+    return cache.get(key)
+
+
+def get_badge_table():
+    """
+    캐시된 뱃지 테이블 반환 (없거나 무효화된 경우에만 DB에서 다시 로드)
+    정상 상태에서는 뱃지 조회 쿼리가 발생하지 않습니다.
+    """
+    global _cached_table, _cached_version
+    version = _shared_version()
+    table = _cached_table
+    if table is not None and version == _cached_version:
+        return table
+
+    with _cache_lock:
+        if _cached_table is None or version != _cached_version:
+            _cached_table = BadgeTable.load()
+            _cached_version = version
+        return _cached_table
+
+
+def invalidate_badge_table():
+    """뱃지 추가/수정/삭제 시 캐시 무효화 (공유 버전 키가 있으면 함께 갱신)"""
+    global _cached_table
+    with _cache_lock:
+        _cached_table = None
+    key = getattr(settings, "BADGE_CACHE_VERSION_KEY", None)
+    if key:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def evaluate_badges(user, table=None):
+    """
+    사용자가 새로 획득한 뱃지를 찾아 저장하고 목록을 반환합니다.
+    이미 보유한 뱃지는 한 번에 조회하고, 새 뱃지는 한 번의 INSERT로 저장합니다.
+    """
+    table = table or get_badge_table()
+    earned = table.earned(user.challenge_streak, user.total_saving)
+    if not earned:
+        return []
+
+    owned = set(
+        UserBadge.objects.filter(
+            user=user, badge_id__in=[badge.id for badge in earned]
+        ).values_list("badge_id", flat=True)
+    )
+    new_badges = [badge for badge in earned if badge.id not in owned]
+    if new_badges:
+        today = timezone.now().date()
+        # 동시 요청으로 이미 저장된 뱃지는 unique 제약으로 무시
+        UserBadge.objects.bulk_create(
+            [
+                UserBadge(user=user, badge=badge, achieved_at=today)
+                for badge in new_badges
+            ],
+            ignore_conflicts=True,
+        )
+    return new_badges
+
+
+def badge_result(new_badges):
+    """check_badges API와 동일한 형태의 응답 데이터"""
+    if new_badges:
+        return {
+            "message": "새로운 뱃지를 획득했습니다!",
+            "badges": BadgeSerializer(new_badges, many=True).data,
+        }
+    return {"message": "획득할 수 있는 새로운 뱃지가 없습니다."}
@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .engine import invalidate_badge_table
+from .models import Badge
+
+
+@receiver(post_save, sender=Badge)
+@receiver(post_delete, sender=Badge)
+def invalidate_badge_cache(sender, **kwargs):
+    # 커밋 이후에 무효화해야 다른 요청이 커밋 전 데이터를 다시 캐시하지 않음
+    transaction.on_commit(invalidate_badge_table)
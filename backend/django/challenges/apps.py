@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ChallengeConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "challenges"
+
+    def ready(self):
+        from . import signals  # noqa: F401 (검색/자동완성 색인 갱신 시그널 등록)
@@ -0,0 +1,158 @@
+"""
+Challenge의 비정규화 카운터 (participant_count / encourage_count / want_count)
+- 참가/탈퇴/강퇴, 반응 변경 시 같은 트랜잭션 안에서 F 식으로 증감
+- 사용자 탈퇴에 따른 CASCADE 삭제 등으로 어긋난 값은 reconcile_challenge_counters 명령으로 복구
+"""
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from .models import Challenge, ChallengeLike, ChallengeParticipant
+
+
+def adjust_counters(challenge_id, **deltas):
+    """카운터를 F 식으로 증감 (예: adjust_counters(1, participant_count=1))"""
+    updates = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if updates:
+        Challenge.objects.filter(id=challenge_id).update(**updates)
+
+
+def add_participant(challenge, user):
+    with transaction.atomic():
+        participant = ChallengeParticipant.objects.create(
+            challenge=challenge,
+            user=user,
+            initial_budget=challenge.budget,
+            balance=challenge.budget,
+            is_failed=False,
+        )
+        adjust_counters(challenge.id, participant_count=1)
+    return participant
+
+
+def join_challenge(challenge, user):
+    """
+    정원이 남아 있을 때만 참가 (조건부 UPDATE 한 번으로 자리 확보 후 참가자 생성)
+    반환: 생성된 참가자, 정원이 찼으면 None
+    이미 참가 중이면 IntegrityError (자리 확보도 함께 롤백)
+    """
+    with transaction.atomic():
+        reserved = Challenge.objects.filter(
+            id=challenge.id, participant_count__lt=F("max_participants")
+        ).update(participant_count=F("participant_count") + 1)
+        if not reserved:
+            return None
+        return ChallengeParticipant.objects.create(
+            challenge=challenge,
+            user=user,
+            initial_budget=challenge.budget,
+            balance=challenge.budget,
+            is_failed=False,
+        )
+
+
+def delete_participant(participant):
+    # 동시 탈퇴/강퇴로 이미 삭제된 경우 카운터를 다시 줄이지 않음
+    with transaction.atomic():
+        deleted, _ = ChallengeParticipant.objects.filter(id=participant.id).delete()
+        if deleted:
+            adjust_counters(participant.challenge_id, participant_count=-1)
+
+
+def set_reaction(challenge_id, user, encourage, want_to_join):
+    """
+    응원/참여희망 반응 저장 (둘 다 False면 삭제)
+    기존 반응과의 차이만큼 카운터 증감, 반환: 저장된 반응 또는 None
+    """
+    with transaction.atomic():
+        reaction = (
+            ChallengeLike.objects.select_for_update()
+            .filter(challenge_id=challenge_id, user=user)
+            .first()
+        )
+        old_encourage = reaction.encourage if reaction else False
+        old_want = reaction.want_to_join if reaction else False
+
+        if not encourage and not want_to_join:
+            if reaction:
+                reaction.delete()
+            reaction = None
+        elif reaction:
+            reaction.encourage = encourage
+            reaction.want_to_join = want_to_join
+            reaction.save(update_fields=["encourage", "want_to_join"])
+        else:
+            reaction = ChallengeLike.objects.create(
+                challenge_id=challenge_id,
+                user=user,
+                encourage=encourage,
+                want_to_join=want_to_join,
+            )
+
+        adjust_counters(
+            challenge_id,
+            encourage_count=int(encourage) - int(old_encourage),
+            want_count=int(want_to_join) - int(old_want),
+        )
+    return reaction
+
+
+def delete_reaction(reaction):
+    with transaction.atomic():
+        # 동시 변경을 반영한 현재 값 기준으로 감소 (이미 삭제됐으면 그대로)
+        reaction = (
+            ChallengeLike.objects.select_for_update().filter(id=reaction.id).first()
+        )
+        if reaction is None:
+            return
+        deleted, _ = reaction.delete()
+        if deleted:
+            adjust_counters(
+                reaction.challenge_id,
+                encourage_count=-int(reaction.encourage),
+                want_count=-int(reaction.want_to_join),
+            )
+
+
+def _count_per_challenge(queryset):
+    """챌린지별 행 수를 세는 상관 서브쿼리"""
+    counts = (
+        queryset.filter(challenge=OuterRef("pk"))
+        .order_by()
+        .values("challenge")
+        .annotate(cnt=Count("id"))
+        .values("cnt")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+ACTUAL_COUNTS = {
+    "participant_count": lambda: _count_per_challenge(ChallengeParticipant.objects),
+    "encourage_count": lambda: _count_per_challenge(
+        ChallengeLike.objects.filter(encourage=True)
+    ),
+    "want_count": lambda: _count_per_challenge(
+        ChallengeLike.objects.filter(want_to_join=True)
+    ),
+}
+
+
+def reconcile_counters(dry_run=False):
+    """
+    실제 행 수와 다른 카운터를 찾아 한 번의 UPDATE로 복구
+    반환: 어긋난 챌린지 id 목록
+    """
+    drifted = Challenge.objects.annotate(
+        **{f"actual_{field}": expression() for field, expression in ACTUAL_COUNTS.items()}
+    ).filter(
+        ~Q(participant_count=F("actual_participant_count"))
+        | ~Q(encourage_count=F("actual_encourage_count"))
+        | ~Q(want_count=F("actual_want_count"))
+    )
+    drifted_ids = list(drifted.values_list("id", flat=True))
+
+    if drifted_ids and not dry_run:
+        with transaction.atomic():
+            Challenge.objects.filter(id__in=drifted_ids).update(
+                **{field: expression() for field, expression in ACTUAL_COUNTS.items()}
+            )
+    return drifted_ids
@@ -0,0 +1,33 @@
+import time
+from django.core.management.base import BaseCommand
+from challenges.ocr_jobs import claim_next_job, requeue_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "대기중인 OCR 작업을 FastAPI OCR 서비스로 처리합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기중인 작업을 모두 처리한 뒤 종료",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="대기 작업이 없을 때 다시 조회하기까지 기다리는 시간(초)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            requeue_stale_jobs()
+            job = claim_next_job()
+            if job is None:
+                if options["once"]:
+                    return
+                time.sleep(options["poll_interval"])
+                continue
+
+            job = run_job(job)
+            self.stdout.write(f"OCR 작업 {job.id}: {job.get_status_display()}")
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from challenges.models import Challenge, ChallengeSearchToken
+from challenges.search import index_challenge
+
+
+class Command(BaseCommand):
+    help = "챌린지 제목/설명 검색 색인을 다시 만듭니다"
+
+    def handle(self, *args, **options):
+        # 일괄 UPDATE로 취소된 챌린지는 시그널이 없으므로 여기서 토큰 정리
+        ChallengeSearchToken.objects.filter(challenge__status=3).delete()
+        count = 0
+        for challenge in Challenge.objects.exclude(status=3).only(
+            "id", "title", "description", "status"
+        ).iterator():
+            index_challenge(challenge)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"챌린지 {count}개의 검색 색인을 만들었습니다"))
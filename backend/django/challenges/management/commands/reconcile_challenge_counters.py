@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from challenges.counters import reconcile_counters
+
+
+class Command(BaseCommand):
+    help = "챌린지 참가자/응원/참여희망 카운터를 실제 행 수와 맞춥니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 어긋난 챌린지만 출력",
+        )
+
+    def handle(self, *args, **options):
+        drifted_ids = reconcile_counters(dry_run=options["dry_run"])
+        if options["dry_run"]:
+            self.stdout.write(f"카운터가 어긋난 챌린지 {len(drifted_ids)}개: {drifted_ids}")
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"챌린지 {len(drifted_ids)}개의 카운터를 복구했습니다")
+            )
@@ -0,0 +1,52 @@
+import time
+from datetime import datetime, timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from challenges.status import update_challenge_status
+
+
+class Command(BaseCommand):
+    help = "챌린지 상태(모집중/진행중/완료/자동취소)를 날짜 기준으로 갱신합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=lambda value: datetime.strptime(value, "%Y-%m-%d").date(),
+            help="기준 날짜 (YYYY-MM-DD, 기본값: 오늘)",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="종료하지 않고 날짜가 바뀔 때마다 한 번씩 실행",
+        )
+
+    def handle(self, *args, **options):
+        if not options["watch"]:
+            self.run(options["date"])
+            return
+
+        last_run_date = None
+        while True:
+            today = timezone.now().date()
+            # 같은 날짜에는 한 번만 실행
+            if today != last_run_date:
+                self.run(today)
+                last_run_date = today
+            time.sleep(self.seconds_until_next_day())
+
+    def run(self, today):
+        result = update_challenge_status(today)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"취소 {result['cancelled']}건, 시작 {result['started']}건, "
+                f"완료 {result['completed']}건"
+            )
+        )
+
+    @staticmethod
+    def seconds_until_next_day():
+        now = timezone.now()
+        next_day = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return max(1, (next_day - now).total_seconds())
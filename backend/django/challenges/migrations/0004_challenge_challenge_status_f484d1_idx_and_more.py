@@ -0,0 +1,35 @@
+# Generated by Django 5.1.15 on 2026-10-18 12:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0003_alter_challengeparticipant_is_failed'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(fields=['status', 'start_date'], name='Challenge_status_f484d1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(fields=['status', 'end_date'], name='Challenge_status_ee7422_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='challenge',
+            index=models.Index(fields=['visibility', 'created_at'], name='Challenge_visibil_d78837_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='challengeparticipant',
+            index=models.Index(fields=['challenge', 'is_failed'], name='ChallengePa_challen_ed392b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(fields=['challenge', 'user', 'payment_date'], name='Expense_challen_f19fe4_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.15 on 2026-10-18 13:03
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_per_challenge(queryset):
+    counts = (
+        queryset.filter(challenge=OuterRef("pk"))
+        .order_by()
+        .values("challenge")
+        .annotate(cnt=Count("id"))
+        .values("cnt")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def backfill_counters(apps, schema_editor):
+    Challenge = apps.get_model("challenges", "Challenge")
+    ChallengeParticipant = apps.get_model("challenges", "ChallengeParticipant")
+    ChallengeLike = apps.get_model("challenges", "ChallengeLike")
+    Challenge.objects.update(
+        participant_count=count_per_challenge(ChallengeParticipant.objects),
+        encourage_count=count_per_challenge(ChallengeLike.objects.filter(encourage=True)),
+        want_count=count_per_challenge(ChallengeLike.objects.filter(want_to_join=True)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0005_ocrjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='challenge',
+            name='encourage_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='challenge',
+            name='participant_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='challenge',
+            name='want_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
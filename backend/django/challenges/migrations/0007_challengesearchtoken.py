@@ -0,0 +1,66 @@
+# Generated by Django 5.1.15 on 2026-10-18 13:07
+
+import django.db.models.deletion
+import re
+import unicodedata
+from collections import Counter
+from django.db import migrations, models
+
+# 마이그레이션 시점의 토큰 규칙 (challenges/search.py가 바뀌어도 이 마이그레이션은 그대로)
+WORD_RE = re.compile(r"\w+")
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text):
+    tokens = []
+    for word in WORD_RE.findall(unicodedata.normalize("NFKC", text or "").lower()):
+        tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        tokens.append(word[-1])
+    return tokens
+
+
+def token_weights(title, description):
+    weights = Counter()
+    for token in tokenize(title):
+        weights[token] += TITLE_WEIGHT
+    for token in tokenize(description):
+        weights[token] += DESCRIPTION_WEIGHT
+    return weights
+
+
+def build_search_index(apps, schema_editor):
+    Challenge = apps.get_model("challenges", "Challenge")
+    ChallengeSearchToken = apps.get_model("challenges", "ChallengeSearchToken")
+    tokens = []
+    for challenge in Challenge.objects.exclude(status=3).iterator():
+        weights = token_weights(challenge.title, challenge.description)
+        tokens.extend(
+            ChallengeSearchToken(challenge_id=challenge.id, token=token, weight=weight)
+            for token, weight in weights.items()
+        )
+    ChallengeSearchToken.objects.bulk_create(tokens, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0006_challenge_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChallengeSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=2)),
+                ('weight', models.PositiveSmallIntegerField()),
+                ('challenge', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='challenges.challenge')),
+            ],
+            options={
+                'db_table': 'ChallengeSearchToken',
+                'indexes': [models.Index(fields=['token', 'challenge'], name='ChallengeSe_token_4e6ac8_idx')],
+            },
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-18 13:25
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('challenges', '0007_challengesearchtoken'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='challenge',
+            name='Challenge_visibil_d78837_idx',
+        ),
+    ]
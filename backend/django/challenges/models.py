@@ -40,9 +40,30 @@ class Challenge(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     status = models.PositiveSmallIntegerField(choices=STATUS_CHOICES, default=0)
     progress_rate = models.FloatField(default=0)
+    # 목록/상세 조회용 비정규화 카운터 (challenges/counters.py에서 갱신)
+    participant_count = models.PositiveIntegerField(default=0)
+    encourage_count = models.PositiveIntegerField(default=0)
+    want_count = models.PositiveIntegerField(default=0)
+
+    COUNTER_FIELDS = ("participant_count", "encourage_count", "want_count")
 
     class Meta:
         db_table = "Challenge"
+        indexes = [
+            models.Index(fields=["status", "start_date"]),  # 모집중 -> 진행중
+            models.Index(fields=["status", "end_date"]),  # 진행중 -> 완료
+        ]
+
+    def save(self, *args, **kwargs):
+        # 카운터는 F 식으로만 증감하므로, 저장된 챌린지를 통째로 저장할 때 제외
+        # (조회 이후 다른 요청의 참가/반응으로 바뀐 값을 메모리의 오래된 값으로 덮어쓰지 않도록)
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
 
 class ChallengeParticipant(models.Model):
@@ -58,6 +79,9 @@ class ChallengeParticipant(models.Model):
     class Meta:
         db_table = "ChallengeParticipant"
         unique_together = ("challenge", "user")
+        indexes = [
+            models.Index(fields=["challenge", "is_failed"]),  # 전원 실패 여부 확인
+        ]
 
 
 class ChallengeInvite(models.Model):
@@ -85,6 +109,9 @@ class Expense(models.Model):
 
     class Meta:
         db_table = "Expense"
+        indexes = [
+            models.Index(fields=["challenge", "user", "payment_date"]),
+        ]
 
 
 class ChallengeLike(models.Model):
@@ -96,3 +123,43 @@ class ChallengeLike(models.Model):
     class Meta:
         db_table = "ChallengeLike"
         unique_together = ("challenge", "user")
+
+
+class OcrJob(models.Model):
+    STATUS_CHOICES = [
+        (0, "PENDING"),  # 대기
+        (1, "RUNNING"),  # 처리중
+        (2, "DONE"),  # 완료
+        (3, "FAILED"),  # 실패
+    ]
+
+    challenge = models.ForeignKey(Challenge, on_delete=models.CASCADE)
+    user = models.ForeignKey("accounts.User", on_delete=models.CASCADE)
+    status = models.PositiveSmallIntegerField(choices=STATUS_CHOICES, default=0)
+    files = models.JSONField(default=list)  # 워커가 읽을 업로드 이미지 경로
+    result = models.JSONField(null=True)  # FastAPI 응답 (results 목록)
+    error = models.CharField(max_length=255, blank=True, default="")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+
+    class Meta:
+        db_table = "OcrJob"
+        indexes = [
+            models.Index(fields=["status", "id"]),  # 워커의 대기 작업 조회
+        ]
+
+
+class ChallengeSearchToken(models.Model):
+    """제목/설명 검색용 역색인 (challenges/search.py에서 저장 시 갱신)"""
+
+    challenge = models.ForeignKey(Challenge, on_delete=models.CASCADE)
+    token = models.CharField(max_length=2)  # 2글자 토큰 (단어의 마지막 글자는 1글자 토큰)
+    weight = models.PositiveSmallIntegerField()  # 등장 횟수 x 필드 가중치
+
+    class Meta:
+        db_table = "ChallengeSearchToken"
+        indexes = [
+            models.Index(fields=["token", "challenge"]),  # 토큰 -> 챌린지 조회
+        ]
@@ -0,0 +1,149 @@
+import logging
+import os
+import shutil
+import uuid
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from sns.service_client import get_client
+from .models import OcrJob
+
+logger = logging.getLogger(__name__)
+
+PENDING, RUNNING, DONE, FAILED = 0, 1, 2, 3
+
+# 처리중 상태로 이 시간이 지난 작업은 워커가 죽은 것으로 보고 다시 대기열로
+# (OCR 호출 제한 시간과 재시도 횟수는 settings.SERVICE_TARGETS["ocr"])
+STALE_AFTER = timedelta(minutes=5)
+MAX_ATTEMPTS = 3
+# 업로드 이미지를 읽어 보내는 단위 (파일 크기와 관계없이 메모리 사용량 일정)
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def new_job_dir():
+    return os.path.join(settings.MEDIA_ROOT, "ocr_jobs", uuid.uuid4().hex)
+
+
+def remove_job_files(files):
+    """작업 이미지가 저장된 디렉터리 삭제"""
+    for directory in {os.path.dirname(file["path"]) for file in files}:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def enqueue_ocr_job(challenge, user, uploaded_files):
+    """
+    업로드 이미지를 디스크에 저장한 뒤 대기 상태의 OCR 작업 생성
+    (행을 먼저 만들면 저장이 끝나기 전에 워커가 빈 작업을 가져갈 수 있음)
+    """
+    directory = new_job_dir()
+    os.makedirs(directory)
+
+    files = []
+    try:
+        for index, file in enumerate(uploaded_files):
+            path = os.path.join(directory, f"{index}_{os.path.basename(file.name)}")
+            with open(path, "wb") as destination:
+                for chunk in file.chunks():
+                    destination.write(chunk)
+            files.append(
+                {"path": path, "name": file.name, "content_type": file.content_type}
+            )
+        return OcrJob.objects.create(challenge=challenge, user=user, files=files)
+    except Exception:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+
+
+def claim_next_job():
+    """
+    대기중인 가장 오래된 작업을 처리중으로 변경하여 반환 (없으면 None)
+    상태 조건부 UPDATE로 선점하므로 여러 워커가 동시에 실행되어도 같은 작업을 중복 처리하지 않음
+    """
+    candidates = OcrJob.objects.filter(status=PENDING).order_by("id")
+    for job_id in candidates.values_list("id", flat=True)[:10]:
+        claimed = OcrJob.objects.filter(id=job_id, status=PENDING).update(
+            status=RUNNING, started_at=timezone.now(), attempts=F("attempts") + 1
+        )
+        if claimed:
+            return OcrJob.objects.get(id=job_id)
+    return None
+
+
+def requeue_stale_jobs():
+    """워커 비정상 종료로 처리중에 멈춘 작업을 다시 대기열에 넣거나 실패 처리"""
+    stale = OcrJob.objects.filter(
+        status=RUNNING, started_at__lt=timezone.now() - STALE_AFTER
+    )
+    expired = dict(stale.filter(attempts__gte=MAX_ATTEMPTS).values_list("id", "files"))
+    failed = OcrJob.objects.filter(id__in=list(expired), status=RUNNING).update(
+        status=FAILED, error="OCR 처리 시간이 초과되었습니다", finished_at=timezone.now()
+    )
+    for files in expired.values():
+        remove_job_files(files)
+    requeued = stale.filter(attempts__lt=MAX_ATTEMPTS).update(status=PENDING)
+    return requeued, failed
+
+
+def iter_multipart(files, boundary):
+    """
+    저장된 이미지들을 multipart/form-data 본문으로 조금씩 읽어 전송
+    (requests의 files=는 파일 전체를 메모리에 올려 본문을 만듦)
+    """
+    for file in files:
+        filename = file["name"].replace('"', "%22")
+        content_type = file["content_type"] or "application/octet-stream"
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        with open(file["path"], "rb") as handle:
+            while chunk := handle.read(UPLOAD_CHUNK_SIZE):
+                yield chunk
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode("utf-8")
+
+
+def call_ocr_service(files):
+    """저장된 이미지들을 FastAPI OCR 서비스로 스트리밍 전송 (chunked, keep-alive 연결 재사용)"""
+    boundary = uuid.uuid4().hex
+    response = get_client("ocr").post(
+        "/extract_text/",
+        # 재시도 시 파일을 처음부터 다시 읽도록 본문 생성 함수 전달
+        data=lambda: iter_multipart(files, boundary),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    if response.status_code != 200:
+        raise RuntimeError("OCR 처리 중 오류가 발생했습니다")
+    payload = response.json()
+    # 오류 응답 등 results 목록이 없는 응답은 실패로 처리 (ocr_status가 results를 그대로 반환)
+    if not isinstance(payload, dict) or not isinstance(payload.get("results"), list):
+        raise RuntimeError("OCR 응답 형식이 올바르지 않습니다")
+    return payload
+
+
+def run_job(job):
+    """작업 하나를 처리하고 결과/오류를 저장"""
+    try:
+        job.result = call_ocr_service(job.files)
+        job.status = DONE
+    except Exception as e:
+        logger.error(f"OCR job {job.id} failed: {str(e)}", exc_info=True)
+        job.status = FAILED
+        job.error = str(e)[:255]
+
+    job.finished_at = timezone.now()
+    # 처리 도중 재대기열로 넘어가 다른 워커가 잡은 경우 결과를 덮어쓰지 않음
+    updated = OcrJob.objects.filter(
+        id=job.id, status=RUNNING, attempts=job.attempts
+    ).update(
+        status=job.status,
+        result=job.result,
+        error=job.error,
+        finished_at=job.finished_at,
+    )
+    if updated:
+        remove_job_files(job.files)
+    return job
@@ -0,0 +1,81 @@
+import base64
+import json
+from datetime import datetime
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+
+
+class KeysetPagination(BasePagination):
+    """
+    (created_at, id) 기준 내림차순 커서(keyset) 페이지네이션
+    - OFFSET 없이 마지막 행의 키 이후만 조회하므로 깊은 페이지도 첫 페이지와 비용이 같음
+    - 커서는 마지막 행의 (created_at, id)를 인코딩한 불투명 토큰
+    """
+
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "유효하지 않은 커서입니다"
+
+    def __init__(
+        self, cursor_query_param="cursor", fields=("created_at", "id")
+    ):
+        self.cursor_query_param = cursor_query_param
+        self.created_field, self.id_field = fields
+        self.next_cursor = None
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(
+            f"-{self.created_field}", f"-{self.id_field}"
+        )
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded:
+            created_at, pk = self.decode_cursor(encoded)
+            queryset = queryset.filter(
+                Q(**{f"{self.created_field}__lt": created_at})
+                | Q(**{self.created_field: created_at, f"{self.id_field}__lt": pk})
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        results = list(queryset[: page_size + 1])
+        if len(results) > page_size:
+            results = results[:page_size]
+            last = results[-1]
+            self.next_cursor = self.encode_cursor(
+                self._resolve(last, self.created_field),
+                self._resolve(last, self.id_field),
+            )
+        else:
+            self.next_cursor = None
+        return results
+
+    def get_next_cursor(self):
+        return self.next_cursor
+
+    def encode_cursor(self, created_at, pk):
+        raw = json.dumps([created_at.isoformat(), pk])
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, encoded):
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8")
+            created_at, pk = json.loads(raw)
+            return datetime.fromisoformat(created_at), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _resolve(obj, path):
+        for attr in path.split("__"):
+            obj = getattr(obj, attr)
+        return obj
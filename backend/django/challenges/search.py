@@ -0,0 +1,119 @@
+"""
+챌린지 제목/설명 검색 (한글 2-gram 역색인)
+- LIKE '%검색어%'는 인덱스를 쓰지 못해 챌린지가 늘수록 느려지므로
+  저장 시 제목/설명을 2글자 토큰으로 잘라 ChallengeSearchToken에 저장하고
+  검색은 (token, challenge) 인덱스로 후보 챌린지만 찾음
+- 검색어의 모든 토큰을 포함한 챌린지만 결과에 포함, 점수는 일치한 토큰 가중치 합
+"""
+import re
+import unicodedata
+from collections import Counter
+from functools import reduce
+from operator import or_
+from django.db import transaction
+from django.db.models import Case, IntegerField, Max, OuterRef, Q, Subquery, Sum, Value, When
+from .models import ChallengeSearchToken
+
+TITLE_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+MAX_QUERY_TOKENS = 16  # 긴 검색어는 앞부분 토큰만 사용
+WORD_RE = re.compile(r"\w+")
+
+
+def normalize(text):
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def words(text):
+    return WORD_RE.findall(normalize(text))
+
+
+def tokenize(text):
+    """
+    단어별 2글자 토큰 + 마지막 글자 1글자 토큰
+    예: "커피값 절약" -> ["커피", "피값", "값", "절약", "약"]
+    (1글자 검색어는 이 글자로 시작하는 토큰으로 찾으므로 단어 끝 글자도 찾을 수 있음)
+    """
+    tokens = []
+    for word in words(text):
+        tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        tokens.append(word[-1])
+    return tokens
+
+
+def token_weights(title, description):
+    """토큰 -> 가중치 (등장 횟수 x 필드 가중치)"""
+    weights = Counter()
+    for token in tokenize(title):
+        weights[token] += TITLE_WEIGHT
+    for token in tokenize(description):
+        weights[token] += DESCRIPTION_WEIGHT
+    return weights
+
+
+def index_challenge(challenge):
+    """챌린지의 토큰을 다시 저장 (삭제된 챌린지는 토큰만 삭제)"""
+    weights = token_weights(challenge.title, challenge.description)
+
+    with transaction.atomic():
+        ChallengeSearchToken.objects.filter(challenge=challenge).delete()
+        if challenge.status != 3:  # DELETED
+            ChallengeSearchToken.objects.bulk_create(
+                ChallengeSearchToken(challenge=challenge, token=token, weight=weight)
+                for token, weight in weights.items()
+            )
+
+
+def query_terms(keyword):
+    """검색어 -> 토큰 조건 목록 (1글자 단어는 그 글자로 시작하는 토큰)"""
+    lookups = []
+    for word in words(keyword):
+        if len(word) == 1:
+            lookups.append(("token__startswith", word))
+        else:
+            lookups.extend(("token", word[i : i + 2]) for i in range(len(word) - 1))
+    return [Q(lookup) for lookup in dict.fromkeys(lookups)][:MAX_QUERY_TOKENS]
+
+
+def match_scores(keyword):
+    """
+    검색어의 모든 토큰과 일치하는 챌린지별 점수 (challenge_id, score)
+    검색어에 토큰이 없으면 None
+    """
+    terms = query_terms(keyword)
+    if not terms:
+        return None
+    # 토큰마다 일치 여부를 집계해 모두 일치한 챌린지만 남김 (HAVING)
+    matched = {
+        f"term_{i}": Max(Case(When(term, then=1), default=0, output_field=IntegerField()))
+        for i, term in enumerate(terms)
+    }
+    return (
+        ChallengeSearchToken.objects.filter(reduce(or_, terms))
+        .values("challenge_id")
+        .alias(**matched)
+        .filter(**{name: 1 for name in matched})
+        .annotate(score=Sum("weight"))
+        .order_by()
+    )
+
+
+def filter_by_keyword(queryset, keyword):
+    """검색어와 일치하는 챌린지로 제한"""
+    matches = match_scores(keyword)
+    if matches is None:
+        return queryset.none()
+    return queryset.filter(id__in=matches.values("challenge_id"))
+
+
+def rank_by_keyword(queryset, keyword):
+    """검색어와 일치하는 챌린지로 제한하고 search_score(높을수록 관련도 높음) 주석 추가"""
+    matches = match_scores(keyword)
+    if matches is None:
+        # 토큰이 없는 검색어("!!" 등)도 search_score로 정렬할 수 있도록 주석은 유지
+        return queryset.annotate(search_score=Value(0)).none()
+    return queryset.filter(id__in=matches.values("challenge_id")).annotate(
+        search_score=Subquery(
+            matches.filter(challenge_id=OuterRef("pk")).values("score")[:1]
+        )
+    )
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.utils import timezone
+from django.db.models import Prefetch
 from datetime import timedelta
 from .models import (
     Challenge,
@@ -149,6 +150,22 @@ class ChallengeListSerializer(serializers.ModelSerializer):
             "progress_percentage",
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        목록 조회에 필요한 참여자 닉네임을 미리 불러옵니다.
+        (인원/응원/참여희망 수는 Challenge의 카운터 컬럼을 그대로 사용)
+        챌린지 수와 관계없이 (본 쿼리 + prefetch 1회)로 직렬화가 끝나도록 합니다.
+        """
+        return queryset.prefetch_related(
+            Prefetch(
+                "challengeparticipant_set",
+                queryset=ChallengeParticipant.objects.select_related("user").only(
+                    "id", "challenge_id", "user__nickname"
+                ),
+            )
+        )
+
     def get_period_display(self, obj):
         weeks = obj.duration // 7
         return f"{weeks}주"
@@ -171,20 +188,26 @@ class ChallengeListSerializer(serializers.ModelSerializer):
         }
         return category_mapping.get(obj.category, "기타")
 
+    # 비정규화 카운터 컬럼 (challenges/counters.py에서 갱신)
     def get_encourage_cnt(self, obj):
-        return obj.challengelike_set.filter(encourage=True).count()
+        return obj.encourage_count
 
     def get_want_cnt(self, obj):
-        return obj.challengelike_set.filter(want_to_join=True).count()
+        return obj.want_count
 
     def get_current_participants(self, obj):
-        return obj.challengeparticipant_set.count()
+        return obj.participant_count
 
     def get_participants_display(self, obj):
         current = self.get_current_participants(obj)
         return f"{current}/{obj.max_participants}"
 
     def get_participants_nicknames(self, obj):
+        # prefetch된 경우 캐시에서 읽음
+        if "challengeparticipant_set" in getattr(
+            obj, "_prefetched_objects_cache", {}
+        ):
+            return [p.user.nickname for p in obj.challengeparticipant_set.all()]
         return list(
             obj.challengeparticipant_set.select_related("user").values_list(
                 "user__nickname", flat=True
@@ -267,7 +290,7 @@ class ChallengeDetailSerializer(serializers.ModelSerializer):
         return convert_number_to_korean(obj.budget)
 
     def get_current_participants(self, obj):
-        return obj.challengeparticipant_set.count()
+        return obj.participant_count
 
     def get_participants_display(self, obj):
         current = self.get_current_participants(obj)
@@ -0,0 +1,36 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Challenge
+from .search import index_challenge
+from .suggest import is_suggestable, refresh_challenge
+
+SEARCH_FIELDS = {"title", "description", "status"}
+SUGGEST_FIELDS = {"title", "visibility", "status"}
+
+
+def saved_fields_changed(fields, update_fields):
+    # update_fields로 다른 필드만 저장한 경우는 갱신 생략
+    return update_fields is None or bool(fields & set(update_fields))
+
+
+@receiver(post_save, sender=Challenge)
+def update_search_index(sender, instance, update_fields=None, **kwargs):
+    if saved_fields_changed(SEARCH_FIELDS, update_fields):
+        index_challenge(instance)
+
+
+@receiver(post_save, sender=Challenge)
+def update_suggest_index(sender, instance, update_fields=None, **kwargs):
+    # 커밋 이후에 반영해야 롤백된 변경이 자동완성에 남지 않음
+    if saved_fields_changed(SUGGEST_FIELDS, update_fields):
+        challenge_id = instance.id
+        title = instance.title if is_suggestable(instance) else None
+        transaction.on_commit(lambda: refresh_challenge(challenge_id, title))
+
+
+@receiver(post_delete, sender=Challenge)
+def remove_from_suggest_index(sender, instance, **kwargs):
+    # 삭제 후에는 instance.id가 None이 되므로 미리 보관
+    challenge_id = instance.id
+    transaction.on_commit(lambda: refresh_challenge(challenge_id))
@@ -0,0 +1,46 @@
+import logging
+from django.db import transaction
+from django.utils import timezone
+from .models import Challenge
+from .suggest import invalidate_suggest_index
+
+logger = logging.getLogger(__name__)
+
+
+def update_challenge_status(today=None):
+    """
+    날짜 경계에 따른 챌린지 상태 전이를 한 번에 수행합니다.
+    - 시작일이 된 모집중 챌린지 중 참가자가 1명(생성자)뿐이면 자동 취소
+    - 모집중 -> 진행중 (start_date <= today)
+    - 진행중 -> 완료 (end_date <= today)
+
+    각 단계는 상태 + 날짜 조건에 해당하는 행만 갱신하므로
+    같은 날 여러 번 실행해도 결과가 같습니다(멱등).
+    """
+    today = today or timezone.now().date()
+
+    with transaction.atomic():
+        # 참가자 1명(생성자)뿐인 챌린지는 시작 전에 먼저 취소
+        cancelled = Challenge.objects.filter(
+            status=0, start_date__lte=today, participant_count__lte=1  # RECRUIT
+        ).update(
+            status=3  # DELETED
+        )
+
+        # 모집중 -> 진행중
+        started = Challenge.objects.filter(status=0, start_date__lte=today).update(
+            status=1  # IN_PROGRESS
+        )
+
+        # 진행중 -> 완료
+        completed = Challenge.objects.filter(status=1, end_date__lte=today).update(
+            status=2  # COMPLETED
+        )
+
+        # 취소/완료된 챌린지는 자동완성에서 제외 (일괄 UPDATE라 시그널이 없음)
+        if cancelled or completed:
+            transaction.on_commit(invalidate_suggest_index)
+
+    result = {"cancelled": cancelled, "started": started, "completed": completed}
+    logger.info(f"Challenge status updated for {today}: {result}")
+    return result
@@ -0,0 +1,157 @@
+"""
+검색어 자동완성 (공개 챌린지 제목 접두사 색인)
+- 제목의 각 단어 시작 위치부터 끝까지의 문자열을 정렬된 배열에 두고
+  bisect로 입력한 접두사 범위만 읽음 (DB 조회 없음)
+- 챌린지 저장/삭제 시 이 프로세스의 색인은 해당 챌린지만 갱신하고,
+  SUGGEST_CACHE_VERSION_KEY 설정 시 공유 캐시 버전을 바꿔 다른 프로세스가 다시 로드하게 함
+  (badges/engine.py의 뱃지 테이블과 같은 방식)
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+from django.conf import settings
+from django.core.cache import cache
+from .models import Challenge
+from .search import WORD_RE, normalize
+
+SUGGEST_STATUSES = (0, 1)  # 모집중, 진행중
+
+
+def is_suggestable(challenge):
+    return not challenge.visibility and challenge.status in SUGGEST_STATUSES
+
+
+class TitlePrefixIndex:
+    """
+    (단어 시작 위치부터의 제목, challenge_id) 정렬 배열
+    예: "커피값 아끼기" -> "커피값 아끼기", "아끼기" 두 키 (어느 단어로 시작해도 찾음)
+    """
+
+    def __init__(self, challenges):
+        self.titles = {}
+        self.keys = []
+        self.lock = threading.Lock()
+        for challenge_id, title in challenges:
+            self.titles[challenge_id] = title
+            self.keys.extend(self.title_keys(challenge_id, title))
+        self.keys.sort()
+
+    @classmethod
+    def load(cls):
+        return cls(
+            Challenge.objects.filter(
+                visibility=False, status__in=SUGGEST_STATUSES
+            ).values_list("id", "title")
+        )
+
+    @staticmethod
+    def title_keys(challenge_id, title):
+        normalized = normalize(title)
+        return [
+            (normalized[match.start() :], challenge_id)
+            for match in WORD_RE.finditer(normalized)
+        ]
+
+    def _remove(self, challenge_id):
+        title = self.titles.pop(challenge_id, None)
+        if title is None:
+            return
+        for key in self.title_keys(challenge_id, title):
+            position = bisect_left(self.keys, key)
+            if position < len(self.keys) and self.keys[position] == key:
+                del self.keys[position]
+
+    def upsert(self, challenge_id, title):
+        with self.lock:
+            self._remove(challenge_id)
+            self.titles[challenge_id] = title
+            for key in self.title_keys(challenge_id, title):
+                insort(self.keys, key)
+
+    def remove(self, challenge_id):
+        with self.lock:
+            self._remove(challenge_id)
+
+    def suggest(self, prefix, limit):
+        """접두사로 시작하는 단어가 있는 챌린지 최대 limit개 [(id, 제목)] (일치한 문자열 순)"""
+        prefix = normalize(prefix).strip()
+        if not prefix:
+            return []
+        results = []
+        seen = set()
+        with self.lock:
+            position = bisect_left(self.keys, (prefix,))
+            while position < len(self.keys) and len(results) < limit:
+                key, challenge_id = self.keys[position]
+                if not key.startswith(prefix):
+                    break
+                if challenge_id not in seen:
+                    seen.add(challenge_id)
+                    results.append((challenge_id, self.titles[challenge_id]))
+                position += 1
+        return results
+
+
+# 프로세스 내 자동완성 색인
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def _shared_version():
+    key = getattr(settings, "SUGGEST_CACHE_VERSION_KEY", None)
+    if not key:
+        return None
+    return cache.get(key)
+
+
+def _bump_shared_version():
+    key = getattr(settings, "SUGGEST_CACHE_VERSION_KEY", None)
+    if not key:
+        return None
+    version = time.time_ns()
+    cache.set(key, version, timeout=None)
+    return version
+
+
+def get_suggest_index():
+    """색인 반환 (처음이거나 다른 프로세스에서 변경된 경우에만 DB에서 로드)"""
+    global _index, _index_version
+    version = _shared_version()
+    index = _index
+    if index is not None and version == _index_version:
+        return index
+
+    with _index_lock:
+        if _index is None or version != _index_version:
+            _index = TitlePrefixIndex.load()
+            _index_version = version
+        return _index
+
+
+def refresh_challenge(challenge_id, title=None):
+    """
+    챌린지 하나의 변경을 반영 (커밋 이후 호출)
+    title이 None이면 자동완성 대상에서 제외 (비공개 전환, 종료, 삭제)
+    """
+    global _index_version
+    with _index_lock:
+        index = _index
+        # 다른 프로세스의 변경을 이미 반영한 상태일 때만 새 버전을 그대로 이어받음
+        up_to_date = index is not None and _shared_version() == _index_version
+        if index is not None:
+            if title is None:
+                index.remove(challenge_id)
+            else:
+                index.upsert(challenge_id, title)
+        version = _bump_shared_version()
+        if up_to_date:
+            _index_version = version
+
+
+def invalidate_suggest_index():
+    """일괄 UPDATE 등 어떤 챌린지가 바뀌었는지 모를 때 전체 다시 로드"""
+    global _index
+    with _index_lock:
+        _index = None
+    _bump_shared_version()
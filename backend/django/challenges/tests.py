@@ -1,3 +1,533 @@
-from django.test import TestCase
+import os
+import tempfile
+from datetime import timedelta
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from accounts.models import User
+from .models import (
+    Challenge,
+    ChallengeLike,
+    ChallengeParticipant,
+    ChallengeSearchToken,
+    Expense,
+    OcrJob,
+)
+from . import ocr_jobs, suggest
+from .serializers import ChallengeCreateSerializer
+from .status import update_challenge_status
+from .views import fail_participant
+from .counters import delete_participant, delete_reaction, reconcile_counters
 
-# Create your tests here.
+
+def index_name(model, fields):
+    """Meta.indexes에서 필드 구성이 일치하는 인덱스 이름 조회"""
+    for index in model._meta.indexes:
+        if list(index.fields) == fields:
+            return index.name
+    raise AssertionError(f"{model.__name__}{fields} 인덱스가 없습니다")
+
+
+def explain(sql):
+    """실제 실행된 SQL의 실행 계획 (SQLite: EXPLAIN QUERY PLAN, MariaDB: EXPLAIN)"""
+    prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql)
+        return "\n".join(" ".join(map(str, row)) for row in cursor.fetchall())
+
+
+class ChallengeIndexTest(TestCase):
+    """
+    상태 갱신 명령 / fail_participant / completed_detail이 실제로 실행하는 쿼리를 캡처해
+    EXPLAIN으로 복합 인덱스 사용 여부 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = timezone.now().date()
+        cls.users = User.objects.bulk_create(
+            User(email=f"user{i}@test.com", nickname=f"user{i}") for i in range(20)
+        )
+        challenges = []
+        for i in range(200):
+            start_date = cls.today + timedelta(days=(i % 30) - 15)
+            challenges.append(
+                Challenge(
+                    creator=cls.users[i % 20],
+                    category=(i % 9) + 1,
+                    title=f"챌린지 {i}",
+                    start_date=start_date,
+                    duration=7,
+                    end_date=start_date + timedelta(days=7),
+                    visibility=i % 3 == 0,
+                    budget=10000,
+                    status=i % 4,
+                )
+            )
+        cls.challenges = Challenge.objects.bulk_create(challenges)
+        ChallengeParticipant.objects.bulk_create(
+            ChallengeParticipant(
+                challenge=challenge,
+                user=user,
+                balance=10000,
+                initial_budget=10000,
+                is_failed=j % 2 == 0,
+            )
+            for challenge in cls.challenges
+            for j, user in enumerate(cls.users[:5])
+        )
+        Expense.objects.bulk_create(
+            Expense(
+                challenge=challenge,
+                user=cls.users[0],
+                store="카페",
+                amount=1000,
+            )
+            for challenge in cls.challenges
+            for _ in range(3)
+        )
+
+    def assertQueriesUseIndex(self, queries, matches, model, fields):
+        """matches(sql)가 참인 캡처된 쿼리가 있고, 모두 인덱스를 사용하는지 확인"""
+        statements = [query["sql"] for query in queries if matches(query["sql"])]
+        self.assertTrue(statements, "대상 쿼리가 실행되지 않았습니다")
+        for sql in statements:
+            plan = explain(sql)
+            self.assertIn(index_name(model, fields), plan, f"{sql}\n{plan}")
+
+    def test_status_transitions(self):
+        with CaptureQueriesContext(connection) as queries:
+            update_challenge_status(self.today)
+
+        def is_update(column):
+            return lambda sql: sql.startswith("UPDATE") and column in sql
+
+        # 자동취소 / 모집중 -> 진행중
+        self.assertQueriesUseIndex(
+            queries, is_update("start_date"), Challenge, ["status", "start_date"]
+        )
+        # 진행중 -> 완료
+        self.assertQueriesUseIndex(
+            queries, is_update("end_date"), Challenge, ["status", "end_date"]
+        )
+
+    def test_fail_participant_all_failed_check(self):
+        challenge = self.challenges[0]
+        participant = ChallengeParticipant.objects.get(
+            challenge=challenge, user=self.users[0]
+        )
+        with CaptureQueriesContext(connection) as queries:
+            fail_participant(participant, challenge)
+
+        # SQLite는 NOT is_failed를 인덱스 탐색 조건으로 쓰지 않지만
+        # challenge_id로 찾은 뒤 is_failed를 인덱스 안에서 확인 (커버링 인덱스)
+        self.assertQueriesUseIndex(
+            queries,
+            lambda sql: sql.startswith("SELECT") and "is_failed" in sql,
+            ChallengeParticipant,
+            ["challenge", "is_failed"],
+        )
+
+    def test_completed_detail_expenses(self):
+        # 공개(i % 3 != 0) + 완료(i % 4 == 2) 챌린지, users[0]은 모든 챌린지 참가자
+        challenge = self.challenges[2]
+        client = APIClient()
+        client.force_authenticate(self.users[0])
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(f"/api/challenges/{challenge.id}/completed_detail/")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertQueriesUseIndex(
+            queries,
+            lambda sql: (
+                sql.startswith("SELECT") and "ORDER BY" in sql and "payment_date" in sql
+            ),
+            Expense,
+            ["challenge", "user", "payment_date"],
+        )
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class OcrJobTest(TestCase):
+    """OCR 요청은 작업만 등록하고, 워커가 처리한 결과를 상태 조회로 받는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        today = timezone.now().date()
+        cls.user = User.objects.create(email="ocr@test.com", nickname="ocr")
+        cls.challenge = Challenge.objects.create(
+            creator=cls.user,
+            category=1,
+            title="OCR 챌린지",
+            start_date=today,
+            duration=7,
+            end_date=today + timedelta(days=7),
+            budget=10000,
+            status=1,
+        )
+        ChallengeParticipant.objects.create(
+            challenge=cls.challenge, user=cls.user, balance=10000, initial_budget=10000
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.base_url = f"/api/challenges/{self.challenge.id}/expenses/ocr/"
+
+    def submit(self):
+        image = SimpleUploadedFile("receipt.png", b"image-bytes", "image/png")
+        response = self.client.post(self.base_url, {"files": [image]}, format="multipart")
+        self.assertEqual(response.status_code, 202)
+        return response.data["job_id"]
+
+    def test_submit_returns_without_calling_ocr_service(self):
+        with mock.patch.object(ocr_jobs, "get_client") as get_client:
+            job_id = self.submit()
+        get_client.assert_not_called()
+
+        job = OcrJob.objects.get(id=job_id)
+        self.assertEqual(job.status, ocr_jobs.PENDING)
+        self.assertTrue(os.path.exists(job.files[0]["path"]))
+
+        response = self.client.get(f"{self.base_url}{job_id}/")
+        self.assertEqual(response.data["status"], "PENDING")
+
+    def test_worker_processes_job_once(self):
+        job_id = self.submit()
+        job = ocr_jobs.claim_next_job()
+        self.assertEqual(job.id, job_id)
+        # 작업 행은 이미지 저장이 끝난 뒤 생성되므로 워커는 항상 파일 목록을 받음
+        self.assertEqual(len(job.files), 1)
+        self.assertIsNone(ocr_jobs.claim_next_job())
+
+        results = [{"store": "카페", "expense": 4500}]
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"results": results}
+        with mock.patch.object(ocr_jobs, "get_client") as get_client:
+            get_client.return_value.post.return_value = response
+            ocr_jobs.run_job(job)
+
+        self.assertFalse(os.path.exists(os.path.dirname(job.files[0]["path"])))
+        response = self.client.get(f"{self.base_url}{job_id}/")
+        self.assertEqual(response.data["status"], "DONE")
+        self.assertEqual(response.data["results"], results)
+
+    def test_malformed_ocr_response_fails_job(self):
+        job_id = self.submit()
+        job = ocr_jobs.claim_next_job()
+
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"detail": "OCR service error"}
+        with mock.patch.object(ocr_jobs, "get_client") as get_client:
+            get_client.return_value.post.return_value = response
+            ocr_jobs.run_job(job)
+
+        response = self.client.get(f"{self.base_url}{job_id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "FAILED")
+        self.assertEqual(response.data["error"], "OCR 응답 형식이 올바르지 않습니다")
+
+    def test_stale_job_is_requeued_then_failed(self):
+        job_id = self.submit()
+        for attempt in range(ocr_jobs.MAX_ATTEMPTS):
+            self.assertEqual(ocr_jobs.claim_next_job().id, job_id)
+            OcrJob.objects.filter(id=job_id).update(
+                started_at=timezone.now() - ocr_jobs.STALE_AFTER * 2
+            )
+            ocr_jobs.requeue_stale_jobs()
+
+        job = OcrJob.objects.get(id=job_id)
+        self.assertEqual(job.status, ocr_jobs.FAILED)
+        self.assertIsNone(ocr_jobs.claim_next_job())
+
+
+class ChallengeCounterTest(TestCase):
+    """참가/탈퇴/강퇴/반응 API가 Challenge 카운터를 실제 행 수와 같게 유지하는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = User.objects.create(email="creator@test.com", nickname="creator")
+        cls.users = User.objects.bulk_create(
+            User(email=f"member{i}@test.com", nickname=f"member{i}") for i in range(3)
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.creator)
+        response = self.client.post(
+            "/api/challenges/",
+            {
+                "challenge_category": 1,
+                "challenge_title": "카운터 챌린지",
+                "challenge_info": "설명",
+                "period": 7,
+                "start_date": timezone.now().date() + timedelta(days=3),
+                "budget": 10000,
+                "max_participants": 3,
+                "is_private": False,
+            },
+        )
+        self.assertEqual(response.status_code, 201)
+        self.challenge = Challenge.objects.get()
+        self.url = f"/api/challenges/{self.challenge.id}/"
+
+    def as_user(self, user):
+        self.client.force_authenticate(user)
+        return self.client
+
+    def assertCounters(self, participants, encourages, wants):
+        self.challenge.refresh_from_db()
+        self.assertEqual(
+            (
+                self.challenge.participant_count,
+                self.challenge.encourage_count,
+                self.challenge.want_count,
+            ),
+            (participants, encourages, wants),
+        )
+        self.assertEqual(reconcile_counters(dry_run=True), [])
+
+    def test_participant_counter(self):
+        self.assertCounters(1, 0, 0)
+        for user in self.users:
+            self.as_user(user).post(f"{self.url}join/")
+        # 최대 인원(3명) 초과 참여는 거절
+        self.assertCounters(3, 0, 0)
+        self.assertEqual(ChallengeParticipant.objects.count(), 3)
+
+        self.as_user(self.users[0]).delete(f"{self.url}leave/")
+        self.assertCounters(2, 0, 0)
+
+        self.as_user(self.creator).delete(
+            f"{self.url}participants/{self.users[1].id}/"
+        )
+        self.assertCounters(1, 0, 0)
+
+    def test_duplicate_join_keeps_counter(self):
+        client = self.as_user(self.users[0])
+        self.assertEqual(client.post(f"{self.url}join/").status_code, 201)
+        response = client.post(f"{self.url}join/")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "이미 참여 중인 챌린지입니다")
+        self.assertCounters(2, 0, 0)
+
+    def test_repeated_delete_decrements_once(self):
+        # 동시 탈퇴/강퇴, 중복 클릭처럼 같은 행을 두 번 삭제하는 경우
+        self.as_user(self.users[0]).post(f"{self.url}join/")
+        self.as_user(self.users[1]).post(f"{self.url}join/")
+        # 두 요청이 각자 조회한 같은 참가자
+        first, second = (
+            ChallengeParticipant.objects.get(user=self.users[0]) for _ in range(2)
+        )
+        delete_participant(first)
+        delete_participant(second)
+        self.assertCounters(2, 0, 0)
+
+        self.as_user(self.users[0]).post(f"{self.url}reactions/", {"encourage": True})
+        self.as_user(self.users[1]).post(f"{self.url}reactions/", {"encourage": True})
+        first, second = (
+            ChallengeLike.objects.get(user=self.users[0]) for _ in range(2)
+        )
+        delete_reaction(first)
+        delete_reaction(second)
+        self.assertCounters(2, 1, 0)
+
+    def test_reaction_counter(self):
+        reactions_url = f"{self.url}reactions/"
+        self.as_user(self.users[0]).post(
+            reactions_url, {"encourage": True, "want_to_join": True}
+        )
+        self.as_user(self.users[1]).post(reactions_url, {"encourage": True})
+        self.assertCounters(1, 2, 1)
+
+        self.as_user(self.users[0]).post(reactions_url, {"want_to_join": True})
+        self.assertCounters(1, 1, 1)
+
+        self.as_user(self.users[0]).post(reactions_url, {})
+        self.assertCounters(1, 1, 0)
+
+        reaction = ChallengeLike.objects.get(user=self.users[1])
+        self.as_user(self.users[1]).delete(f"{reactions_url}{reaction.id}/")
+        self.assertCounters(1, 0, 0)
+
+    def test_concurrent_join_survives_challenge_save(self):
+        # 수정/삭제 요청이 챌린지를 조회한 뒤 다른 사용자의 참가가 먼저 커밋된 경우
+        stale = Challenge.objects.get(id=self.challenge.id)
+        self.as_user(self.users[0]).post(f"{self.url}join/")
+
+        serializer = ChallengeCreateSerializer(
+            stale, data={"challenge_title": "수정된 제목"}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        self.assertCounters(2, 0, 0)
+
+        stale.status = 3
+        stale.save()
+        self.assertCounters(2, 0, 0)
+        self.assertEqual(self.challenge.title, "수정된 제목")
+
+    def test_reconcile_repairs_drift(self):
+        self.as_user(self.users[0]).post(f"{self.url}join/")
+        # CASCADE 삭제처럼 카운터를 거치지 않은 변경
+        ChallengeParticipant.objects.filter(user=self.users[0]).delete()
+        Challenge.objects.filter(id=self.challenge.id).update(want_count=5)
+
+        self.assertEqual(reconcile_counters(), [self.challenge.id])
+        self.assertCounters(1, 0, 0)
+
+
+class ChallengeSearchTest(TestCase):
+    """2-gram 색인 검색 결과/순위와 저장 시 색인 갱신 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email="search@test.com", nickname="search")
+        start_date = timezone.now().date() + timedelta(days=3)
+
+        def create(title, description, **extra):
+            return Challenge.objects.create(
+                creator=cls.user,
+                category=extra.pop("category", 1),
+                title=title,
+                description=description,
+                start_date=start_date,
+                duration=7,
+                end_date=start_date + timedelta(days=7),
+                budget=10000,
+                **extra,
+            )
+
+        cls.title_match = create("커피값 아끼기", "한 달 동안 도전")
+        cls.description_match = create("절약 챌린지", "매일 커피 대신 물 마시기", category=2)
+        cls.private = create("비밀 커피 모임", "초대 전용", visibility=True)
+        cls.unrelated = create("택시 안 타기", "대중교통 이용", category=8)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def search(self, keyword, **params):
+        response = self.client.get("/api/challenges/search/", {"q": keyword, **params})
+        self.assertEqual(response.status_code, 200)
+        return [challenge["challenge_id"] for challenge in response.data]
+
+    def list_ids(self, **params):
+        response = self.client.get("/api/challenges/", params)
+        self.assertEqual(response.status_code, 200)
+        return {challenge["challenge_id"] for challenge in response.data["recruiting"]}
+
+    def test_rank_title_before_description(self):
+        # Private 챌린지는 검색에서 제외
+        self.assertEqual(
+            self.search("커피"), [self.title_match.id, self.description_match.id]
+        )
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.search("커피 마시기"), [self.description_match.id])
+        self.assertEqual(self.search("커피 택시"), [])
+
+    def test_punctuation_only_keyword(self):
+        # 토큰이 하나도 없는 검색어는 빈 결과
+        self.assertEqual(self.search("!!"), [])
+        self.assertEqual(self.list_ids(search="!!"), set())
+
+    def test_single_character_keyword(self):
+        # 단어 첫 글자 / 끝 글자 모두 검색
+        self.assertEqual(self.search("택"), [self.unrelated.id])
+        self.assertEqual(self.search("값"), [self.title_match.id])
+
+    def test_list_search_and_category(self):
+        self.assertEqual(
+            self.list_ids(search="커피"),
+            {self.title_match.id, self.description_match.id},
+        )
+        self.assertEqual(
+            self.list_ids(search="커피", category="restaurant"),
+            {self.description_match.id},
+        )
+
+    def test_index_follows_updates(self):
+        self.unrelated.title = "커피 끊기"
+        self.unrelated.save()
+        self.assertIn(self.unrelated.id, self.search("커피"))
+
+        self.unrelated.status = 3
+        self.unrelated.save(update_fields=["status"])
+        self.assertFalse(ChallengeSearchToken.objects.filter(challenge=self.unrelated).exists())
+
+
+class ChallengeSuggestTest(TestCase):
+    """자동완성 색인의 접두사 검색과 저장/삭제 시 갱신 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email="suggest@test.com", nickname="suggest")
+        cls.start_date = timezone.now().date() + timedelta(days=3)
+        cls.coffee = cls.create("커피값 아끼기")
+        cls.taxi = cls.create("택시 대신 걷기")
+        cls.private = cls.create("커피 비밀 모임", visibility=True)
+        cls.completed = cls.create("커피 완료", status=2)
+
+    @classmethod
+    def create(cls, title, **extra):
+        return Challenge.objects.create(
+            creator=cls.user,
+            category=1,
+            title=title,
+            start_date=cls.start_date,
+            duration=7,
+            end_date=cls.start_date + timedelta(days=7),
+            budget=10000,
+            **extra,
+        )
+
+    def setUp(self):
+        suggest.invalidate_suggest_index()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def suggest(self, prefix):
+        response = self.client.get("/api/challenges/suggest/", {"q": prefix})
+        self.assertEqual(response.status_code, 200)
+        return [item["challenge_id"] for item in response.data]
+
+    def test_prefix_of_any_word(self):
+        # 비공개/종료 챌린지는 제외
+        self.assertEqual(self.suggest("커"), [self.coffee.id])
+        self.assertEqual(self.suggest("걷"), [self.taxi.id])
+        self.assertEqual(self.suggest("아끼기 "), [self.coffee.id])
+        self.assertEqual(self.suggest("피"), [])
+        self.assertEqual(self.suggest(" "), [])
+
+    def test_refresh_on_save_and_delete(self):
+        self.assertEqual(self.suggest("택시"), [self.taxi.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.taxi.title = "버스 타기"
+            self.taxi.save()
+            created = self.create("택시비 줄이기")
+        self.assertEqual(self.suggest("택시"), [created.id])
+        self.assertEqual(self.suggest("버스"), [self.taxi.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            created.delete()
+            self.coffee.status = 3
+            self.coffee.save(update_fields=["status"])
+        self.assertEqual(self.suggest("택시"), [])
+        self.assertEqual(self.suggest("커피"), [])
+
+    def test_all_failed_challenge_is_removed(self):
+        in_progress = self.create("배달 끊기", status=1)
+        participant = ChallengeParticipant.objects.create(
+            challenge=in_progress, user=self.user, balance=0, initial_budget=10000
+        )
+        self.assertEqual(self.suggest("배달"), [in_progress.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(fail_participant(participant, in_progress))
+        self.assertEqual(self.suggest("배달"), [])
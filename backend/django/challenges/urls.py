@@ -87,6 +87,12 @@ urlpatterns = [
         views.ExpenseViewSet.as_view({"post": "ocr"}),
         name="challenge-expense-ocr",
     ),
+    # OCR 작업 상태 및 결과 조회
+    path(
+        "<int:challenge_id>/expenses/ocr/<int:job_id>/",
+        views.ExpenseViewSet.as_view({"get": "ocr_status"}),
+        name="challenge-expense-ocr-status",
+    ),
     # OCR 저장
     path(
         "<int:challenge_id>/expenses/verifications/",
@@ -1,24 +1,35 @@
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db import models
-from django.db.models import Q
-from rest_framework import viewsets, status, filters, permissions
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q
+from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
-import requests
 import json
 import logging
 from datetime import date
 from accounts.models import User
 from accounts.serializers import UserListSerializer
+from badges.engine import evaluate_badges, badge_result
 from .models import (
     Challenge,
     ChallengeParticipant,
     ChallengeInvite,
     Expense,
     ChallengeLike,
+    OcrJob,
+)
+from .ocr_jobs import enqueue_ocr_job, DONE, FAILED
+from .search import filter_by_keyword, rank_by_keyword
+from .suggest import get_suggest_index, refresh_challenge
+from .counters import (
+    add_participant,
+    join_challenge,
+    delete_participant,
+    set_reaction,
+    delete_reaction,
 )
 from .serializers import (
     ChallengeCreateSerializer,
@@ -30,34 +41,21 @@ from .serializers import (
     ExpenseCreateSerializer,
     SimpleExpenseCreateSerializer,
 )
+from .pagination import KeysetPagination
 from django.conf import settings
 import os
 
 logger = logging.getLogger(__name__)
 
+SEARCH_MAX_LIMIT = 50  # 관련도순 검색 결과 최대 개수
+SUGGEST_MAX_LIMIT = 20  # 자동완성 결과 최대 개수
+
 
 class ChallengeViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ["title", "description"]
-
-    def update_challenge_status(self):
-        today = timezone.now().date()
-
-        # 모집중 -> 진행중
-        Challenge.objects.filter(status=0, start_date__lte=today).update(  # RECRUIT
-            status=1
-        )  # IN_PROGRESS
-
-        # 진행중 -> 완료
-        Challenge.objects.filter(status=1, end_date__lte=today).update(  # IN_PROGRESS
-            status=2
-        )  # COMPLETED
 
     def get_queryset(self):
-        # 상태 업데이트 먼저 수행
-        self.update_challenge_status()
-
+        # 상태 전이는 update_challenge_status 관리 명령이 날짜 경계마다 수행
         queryset = Challenge.objects.exclude(status=3).select_related(
             "creator"
         )  # Exclude deleted challenges
@@ -80,16 +78,12 @@ class ChallengeViewSet(viewsets.ModelViewSet):
         elif status_param == "in_progress":
             queryset = queryset.filter(status=1)  # IN_PROGRESS
 
-        # 검색어 필터링
+        # 검색어 필터링 (제목/설명 2-gram 색인 사용, challenges/search.py)
         search_keyword = self.request.query_params.get("search")
         if search_keyword:
             # Private 챌린지는 검색에서 제외
-            queryset = queryset.filter(
-                Q(visibility=False)  # Public 챌린지만 검색
-                & (
-                    Q(title__icontains=search_keyword)
-                    | Q(description__icontains=search_keyword)
-                )
+            queryset = filter_by_keyword(
+                queryset.filter(visibility=False), search_keyword
             )
 
         category = self.request.query_params.get("category")
@@ -110,18 +104,55 @@ class ChallengeViewSet(viewsets.ModelViewSet):
             if category_id:
                 queryset = queryset.filter(category=category_id)
 
-        search_keyword = self.request.query_params.get("search")
-        if search_keyword:
-            queryset = queryset.filter(
-                Q(title__icontains=search_keyword)
-                | Q(description__icontains=search_keyword)
+        # 목록 조회 시 참여자 닉네임을 한 번에 로드
+        if self.action in ("list", "search"):
+            queryset = ChallengeListSerializer.setup_eager_loading(queryset)
+
+        return queryset.order_by("-created_at")
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        관련도순 검색: ?q=검색어&limit=20 (status/category 필터 함께 사용 가능)
+        제목 일치가 설명 일치보다 높은 점수, 점수가 같으면 최신순
+        """
+        keyword = request.query_params.get("q", "").strip()
+        if not keyword:
+            return Response(
+                {"error": "검색어를 입력해주세요"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
+        try:
+            limit = min(int(request.query_params.get("limit", 20)), SEARCH_MAX_LIMIT)
+        except ValueError:
+            limit = 20
 
-        # 카테고리 필터링이 있는 경우
-        if category:
-            queryset = queryset.filter(category=category)
+        # Private 챌린지는 검색에서 제외
+        queryset = rank_by_keyword(
+            self.get_queryset().filter(visibility=False), keyword
+        ).order_by("-search_score", "-created_at")[: max(limit, 1)]
+        return Response(ChallengeListSerializer(queryset, many=True).data)
 
-        return queryset.order_by("-created_at")
+    @action(detail=False, methods=["get"])
+    def suggest(self, request):
+        """
+        입력 중 자동완성: ?q=접두사&limit=10
+        공개된 모집중/진행중 챌린지 중 제목의 단어가 접두사로 시작하는 것 (메모리 색인, DB 조회 없음)
+        """
+        try:
+            limit = min(int(request.query_params.get("limit", 10)), SUGGEST_MAX_LIMIT)
+        except ValueError:
+            limit = 10
+
+        suggestions = get_suggest_index().suggest(
+            request.query_params.get("q", ""), max(limit, 1)
+        )
+        return Response(
+            [
+                {"challenge_id": challenge_id, "challenge_title": title}
+                for challenge_id, title in suggestions
+            ]
+        )
 
     @action(detail=True, methods=["get"])
     def invitable_users(self, request, pk=None):
@@ -160,23 +191,26 @@ class ChallengeViewSet(viewsets.ModelViewSet):
         today = date.today()
 
         # 기존 queryset에서 필터링
-        recruiting_challenges = queryset.filter(status=0, start_date__gt=today)
-
-        in_progress_challenges = queryset.filter(status=1)
+        sections = {
+            "recruiting": queryset.filter(status=0, start_date__gt=today),
+            "in_progress": queryset.filter(status=1),
+        }
 
-        recruiting_serializer = ChallengeListSerializer(
-            recruiting_challenges, many=True
-        )
-        in_progress_serializer = ChallengeListSerializer(
-            in_progress_challenges, many=True
-        )
+        return Response(self.paginate_sections(request, sections))
 
-        return Response(
-            {
-                "recruiting": recruiting_serializer.data,
-                "in_progress": in_progress_serializer.data,
-            }
-        )
+    def paginate_sections(self, request, sections):
+        """
+        구역(모집중/진행중/...)별로 커서 페이지네이션을 적용합니다.
+        각 구역은 `<구역>_cursor` 파라미터로 다음 페이지를 조회하고,
+        응답의 `<구역>_next`에 다음 페이지 커서가 담깁니다(마지막 페이지면 null).
+        """
+        data = {}
+        for name, queryset in sections.items():
+            paginator = KeysetPagination(cursor_query_param=f"{name}_cursor")
+            page = paginator.paginate_queryset(queryset, request, view=self)
+            data[name] = ChallengeListSerializer(page, many=True).data
+            data[f"{name}_next"] = paginator.get_next_cursor()
+        return data
 
     def get_serializer_class(self):
         if self.action in ["create", "update", "partial_update"]:
@@ -186,15 +220,11 @@ class ChallengeViewSet(viewsets.ModelViewSet):
         return ChallengeListSerializer
 
     def perform_create(self, serializer):
-        challenge = serializer.save(creator=self.request.user)
+        with transaction.atomic():
+            challenge = serializer.save(creator=self.request.user)
 
-        # 챌린지 생성자를 참여자로 자동 등록
-        ChallengeParticipant.objects.create(
-            challenge=challenge,
-            user=self.request.user,
-            initial_budget=challenge.budget,
-            balance=challenge.budget,
-        )
+            # 챌린지 생성자를 참여자로 자동 등록
+            add_participant(challenge, self.request.user)
 
     def perform_update(self, serializer):
         instance = self.get_object()
@@ -210,7 +240,7 @@ class ChallengeViewSet(viewsets.ModelViewSet):
         if instance.status != 0:  # RECRUIT
             raise PermissionDenied("모집 중인 챌린지만 삭제할 수 있습니다")
         instance.status = 3  # DELETED
-        instance.save()
+        instance.save(update_fields=["status"])
 
     @action(detail=True, methods=["post"])
     def join(self, request, pk=None):
@@ -239,28 +269,21 @@ class ChallengeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if challenge.challengeparticipant_set.count() >= challenge.max_participants:
+        # 정원 확인과 자리 확보를 조건부 UPDATE 한 번으로 처리 (동시 참여 시 초과 방지)
+        try:
+            participant = join_challenge(challenge, request.user)
+        except IntegrityError:
             return Response(
-                {"error": "최대 참여 인원을 초과했습니다"},
+                {"error": "이미 참여 중인 챌린지입니다"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if ChallengeParticipant.objects.filter(
-            challenge=challenge, user=request.user
-        ).exists():
+        if participant is None:
             return Response(
-                {"error": "이미 참여 중인 챌린지입니다"},
+                {"error": "최대 참여 인원을 초과했습니다"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        participant = ChallengeParticipant.objects.create(
-            challenge=challenge,
-            user=request.user,
-            initial_budget=challenge.budget,
-            balance=challenge.budget,
-            is_failed=False,
-        )
-
         return Response(status=status.HTTP_201_CREATED)
 
     @action(detail=True, methods=["post"])
@@ -300,7 +323,7 @@ class ChallengeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        participant.delete()
+        delete_participant(participant)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=False, methods=["get"])
@@ -308,22 +331,21 @@ class ChallengeViewSet(viewsets.ModelViewSet):
         # 내가 참여중인 챌린지들 조회
         today = timezone.now().date()
 
-        my_challenges = Challenge.objects.filter(
-            challengeparticipant__user=request.user
-        ).select_related("creator")
+        my_challenges = ChallengeListSerializer.setup_eager_loading(
+            Challenge.objects.filter(challengeparticipant__user=request.user)
+            .select_related("creator")
+        )
 
         # 모집중/진행중/완료 챌린지 분리
-        recruiting = my_challenges.filter(status=0, start_date__gt=today)  # RECRUIT
-        in_progress = my_challenges.filter(status=1)  # IN_PROGRESS
-        completed = my_challenges.filter(status=2)
+        sections = {
+            "recruiting": my_challenges.filter(
+                status=0, start_date__gt=today
+            ),  # RECRUIT
+            "in_progress": my_challenges.filter(status=1),  # IN_PROGRESS
+            "completed": my_challenges.filter(status=2),  # COMPLETED
+        }
 
-        return Response(
-            {
-                "recruiting": ChallengeListSerializer(recruiting, many=True).data,
-                "in_progress": ChallengeListSerializer(in_progress, many=True).data,
-                "completed": ChallengeListSerializer(completed, many=True).data,
-            }
-        )
+        return Response(self.paginate_sections(request, sections))
 
     @action(detail=False, methods=["get"])
     def my_history(self, request):
@@ -332,9 +354,15 @@ class ChallengeViewSet(viewsets.ModelViewSet):
             user=request.user
         ).select_related("challenge", "challenge__creator")
 
+        # 챌린지 생성일 기준 커서 페이지네이션
+        paginator = KeysetPagination(
+            fields=("challenge__created_at", "challenge__id")
+        )
+        page = paginator.paginate_queryset(participations, request, view=self)
+
         # 성공/실패 여부, 잔여 금액 등의 상세 정보도 포함
         history_data = []
-        for participation in participations:
+        for participation in page:
             challenge = participation.challenge
             history_data.append(
                 {
@@ -351,7 +379,13 @@ class ChallengeViewSet(viewsets.ModelViewSet):
                 }
             )
 
-        return Response({"total_count": len(history_data), "histories": history_data})
+        return Response(
+            {
+                "total_count": participations.count(),
+                "histories": history_data,
+                "next": paginator.get_next_cursor(),
+            }
+        )
 
     @action(detail=True, methods=["get"])
     def completed_detail(self, request, pk=None):
@@ -493,7 +527,7 @@ class ChallengeViewSet(viewsets.ModelViewSet):
         participant = get_object_or_404(
             ChallengeParticipant, challenge=challenge, user_id=user_id
         )
-        participant.delete()
+        delete_participant(participant)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -513,32 +547,73 @@ class ChallengeViewSet(viewsets.ModelViewSet):
             )
 
         challenge.status = 3  # DELETED (취소)
-        challenge.save()
+        challenge.save(update_fields=["status"])
 
         return Response({"message": "챌린지가 취소되었습니다"})
 
-    def update_challenge_status(self):
-        today = timezone.now().date()
 
-        # 모집중 -> 진행중
-        Challenge.objects.filter(status=0, start_date=today).update(  # RECRUIT
-            status=1
-        )  # IN_PROGRESS
-
-        # 진행중 -> 완료
-        Challenge.objects.filter(status=1, end_date=today).update(  # IN_PROGRESS
-            status=2
-        )  # COMPLETED
-
-        # 모집 중인 챌린지 중 시작일이 된 시점에
-        # 참가자가 1명(생성자)뿐인 챌린지는 자동 취소
-        challenges_to_cancel = (
-            Challenge.objects.filter(status=0, start_date=today)
-            .annotate(participant_count=models.Count("challengeparticipant"))
-            .filter(participant_count=1)
+def debit_balance(participant, amount):
+    """
+    잔액이 충분할 때만 조건부 UPDATE로 차감합니다.
+    (UPDATE ... SET balance = balance - amount WHERE balance >= amount)
+    동시 요청에서도 잔액이 음수가 되지 않으며, 차감 성공 여부를 반환합니다.
+    """
+    return bool(
+        ChallengeParticipant.objects.filter(
+            pk=participant.pk, is_failed=False, balance__gte=amount
+        ).update(balance=F("balance") - amount)
+    )
+
+
+def count_daily_verification(participant, user, today):
+    """
+    오늘 첫 인증이면 ocr_count와 사용자의 challenge_streak를 1 증가시킵니다.
+    last_ocr_date 조건부 UPDATE이므로 동시 요청에서도 하루 한 번만 증가합니다.
+    """
+    counted = (
+        ChallengeParticipant.objects.filter(pk=participant.pk)
+        .exclude(last_ocr_date=today)
+        .update(ocr_count=F("ocr_count") + 1, last_ocr_date=today)
+    )
+    if counted:
+        User.objects.filter(pk=user.pk).update(
+            challenge_streak=F("challenge_streak") + 1
         )
+    return bool(counted)
+
+
+def fail_participant(participant, challenge):
+    """
+    참가자를 실패 처리하고, 모든 참가자가 실패했다면 챌린지를 종료합니다.
+    모든 참가자가 실패했는지 여부를 반환합니다.
+    """
+    ChallengeParticipant.objects.filter(pk=participant.pk).update(is_failed=True)
+
+    # 챌린지의 모든 참가자가 실패했는지 확인
+    all_failed = not ChallengeParticipant.objects.filter(
+        challenge=challenge,
+        is_failed=False,  # 실패하지 않은 참가자가 있는지 확인
+    ).exists()
+
+    # 모든 참가자가 실패했다면 챌린지도 종료
+    if all_failed:
+        completed = Challenge.objects.filter(pk=challenge.pk, status=1).update(
+            status=2  # COMPLETED
+        )
+        # 일괄 UPDATE라 시그널이 없으므로 종료된 챌린지를 자동완성에서 직접 제외
+        if completed:
+            challenge_id = challenge.pk
+            transaction.on_commit(lambda: refresh_challenge(challenge_id))
+    return all_failed
+
 
-        challenges_to_cancel.update(status=3)  # DELETED
+def check_new_badges(user):
+    """인증 후 새로 획득한 뱃지 확인 (실패해도 인증 결과에는 영향 없음)"""
+    try:
+        return badge_result(evaluate_badges(user))
+    except Exception as e:
+        logger.error(f"Badge check error: {str(e)}", exc_info=True)
+        return None
 
 
 class ExpenseViewSet(viewsets.ModelViewSet):
@@ -622,7 +697,7 @@ class ExpenseViewSet(viewsets.ModelViewSet):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    # OCR 처리를 위한 기존 액션 수정
+    # OCR 작업 등록 (즉시 job_id 반환)
     @action(detail=False, methods=["post"])
     def ocr(self, request, challenge_id=None):
         try:
@@ -643,24 +718,19 @@ class ExpenseViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # 업로드된 파일들을 직접 FastAPI로 전송
-            files = [
-                ("files", (file.name, file, file.content_type))
-                for file in request.FILES.getlist("files")
-            ]
-
-            # FastAPI 호출
-            response = requests.post(
-                "http://fastapi-app:8001/extract_text/", files=files, timeout=90
-            )
-
-            if response.status_code != 200:
+            uploaded_files = request.FILES.getlist("files")
+            if not uploaded_files:
                 return Response(
-                    {"error": "OCR 처리 중 오류가 발생했습니다"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    {"error": "업로드된 이미지가 없습니다"},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            return Response(response.json())
+            # OCR은 워커(process_ocr_jobs)가 처리하고 결과는 ocr_status로 조회
+            job = enqueue_ocr_job(challenge, request.user, uploaded_files)
+            return Response(
+                {"job_id": job.id, "status": job.get_status_display()},
+                status=status.HTTP_202_ACCEPTED,
+            )
 
         except Exception as e:
             logger.error(f"OCR processing error: {str(e)}", exc_info=True)
@@ -668,6 +738,19 @@ class ExpenseViewSet(viewsets.ModelViewSet):
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    # OCR 작업 상태 및 결과 조회
+    @action(detail=False, methods=["get"])
+    def ocr_status(self, request, challenge_id=None, job_id=None):
+        job = get_object_or_404(
+            OcrJob, id=job_id, challenge_id=challenge_id, user=request.user
+        )
+        data = {"job_id": job.id, "status": job.get_status_display()}
+        if job.status == DONE:
+            data["results"] = job.result.get("results", [])
+        elif job.status == FAILED:
+            data["error"] = job.error
+        return Response(data)
+
     # OCR 데이터 저장
     @action(detail=False, methods=["post"])
     def ocr_save(self, request, challenge_id=None):
@@ -699,88 +782,52 @@ class ExpenseViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # 각 지출 데이터의 필수 필드 검증
+            # 지출 데이터 일괄 검증 후 저장할 Expense 객체 생성
             required_fields = ["store", "amount"]
+            expenses = []
             for expense_data in expenses_data:
                 if not all(field in expense_data for field in required_fields):
                     return Response(
                         {"error": "필수 필드가 누락되었습니다"},
                         status=status.HTTP_400_BAD_REQUEST,
                     )
-
-            # 총 지출 금액 계산
-            total_amount = sum(int(expense["amount"]) for expense in expenses_data)
-
-            # 오늘 날짜에 ocr_count가 증가했는지 확인
-            today = timezone.now().date()
-            last_ocr_date = getattr(participant, "last_ocr_date", None)
-
-            if total_amount <= participant.balance:
-                # 인증 성공 처리
-                if last_ocr_date != today:
-                    participant.ocr_count += 1
-                    participant.last_ocr_date = today
-                    # User의 challenge_streak를 ocr_count와 동일하게 업데이트
-                    request.user.challenge_streak += 1
-                    request.user.save()
-
-                # 잔액 업데이트 및 지출 데이터 저장
-                participant.balance -= total_amount
-                participant.save()
-
-                created_expenses = []
-                for expense_data in expenses_data:
-                    expense = Expense.objects.create(
+                amount = int(expense_data["amount"])
+                if amount <= 0:
+                    return Response(
+                        {"error": "결제 금액은 0보다 커야 합니다"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                expenses.append(
+                    Expense(
                         challenge=challenge,
                         user=request.user,
                         store=expense_data["store"],
-                        amount=int(expense_data["amount"]),
-                        payment_date=expense_data.get("payment_date"),
+                        amount=amount,
                     )
-                    created_expenses.append(expense.id)
+                )
 
-                # 뱃지 체크 API 호출
-                try:
-                    badge_response = requests.post(
-                        "http://django-app:8000/api/badges/check_badges/",
-                        headers={"Authorization": request.headers.get("Authorization")},
-                    )
-                    badge_result = (
-                        badge_response.json()
-                        if badge_response.status_code == 200
-                        else None
-                    )
-                except Exception as e:
-                    badge_result = None
+            # 총 지출 금액 계산
+            total_amount = sum(expense.amount for expense in expenses)
 
-                return Response(
-                    {
-                        "message": "지출 내역이 저장되었습니다",
-                        "expense_ids": created_expenses,
-                        "total_amount": total_amount,
-                        "remaining_balance": participant.balance,
-                        "ocr_count": participant.ocr_count,
-                        "challenge_streak": request.user.challenge_streak,
-                        "badge_result": badge_result,
-                    },
-                    status=status.HTTP_201_CREATED,
-                )
-            else:
-                # 챌린지 실패 처리
-                participant.is_failed = 1
-                participant.save()
-
-                # 챌린지의 모든 참가자가 실패했는지 확인
-                all_failed = not ChallengeParticipant.objects.filter(
-                    challenge=challenge,
-                    is_failed=0,  # 실패하지 않은 참가자가 있는지 확인
-                ).exists()
-
-                # 모든 참가자가 실패했다면 챌린지도 종료
-                if all_failed:
-                    challenge.status = 2  # FINISHED 상태 코드
-                    challenge.save()
+            today = timezone.now().date()
 
+            # 잔액 차감, 인증 횟수 증가, 지출 저장을 하나의 트랜잭션으로 처리
+            with transaction.atomic():
+                debited = debit_balance(participant, total_amount)
+                if debited:
+                    count_daily_verification(participant, request.user, today)
+
+                    # 지출 내역을 한 번의 INSERT로 저장 (payment_date는 auto_now_add로 오늘)
+                    created_expenses = [
+                        expense.id for expense in Expense.objects.bulk_create(expenses)
+                    ]
+                else:
+                    # 챌린지 실패 처리
+                    all_failed = fail_participant(participant, challenge)
+
+            participant.refresh_from_db(fields=["balance", "ocr_count"])
+
+            if not debited:
                 return Response(
                     {
                         "message": "사용 금액이 잔액을 초과하여 챌린지에 실패했습니다",
@@ -791,6 +838,24 @@ class ExpenseViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            request.user.refresh_from_db(fields=["challenge_streak", "total_saving"])
+
+            # 뱃지 체크 (프로세스 내 호출)
+            badge_data = check_new_badges(request.user)
+
+            return Response(
+                {
+                    "message": "지출 내역이 저장되었습니다",
+                    "expense_ids": created_expenses,
+                    "total_amount": total_amount,
+                    "remaining_balance": participant.balance,
+                    "ocr_count": participant.ocr_count,
+                    "challenge_streak": request.user.challenge_streak,
+                    "badge_result": badge_data,
+                },
+                status=status.HTTP_201_CREATED,
+            )
+
         except Exception as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -835,64 +900,37 @@ class SimpleExpenseViewSet(viewsets.ViewSet):
             if not serializer.is_valid():
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-            # 오늘 날짜에 지출내역이 있는지 확인
             today = timezone.now().date()
-            today_expense = Expense.objects.filter(
-                challenge=challenge, user=request.user, payment_date=today
-            ).exists()
-
-            # 잔액 확인
             amount = serializer.validated_data["amount"]
-            if participant.balance < amount:
-                return Response(
-                    {"error": "잔액이 부족합니다"}, status=status.HTTP_400_BAD_REQUEST
-                )
 
-            # 오늘 첫 인증이면 ocr_count 증가
-            if not today_expense:
-                participant.ocr_count += 1
-                participant.last_ocr_date = today
-                # User의 challenge_streak 증가
-                request.user.challenge_streak += 1
-                request.user.save()
-                participant.save()
-
-            # 지출 내역 저장
-            expense = serializer.save()
-
-            # 잔액 업데이트
-            participant.balance -= amount
-            participant.save()
-
-            # 뱃지 체크 API 호출
-            try:
-                badge_response = requests.post(
-                    "http://django-app:8000/api/badges/check_badges/",
-                    headers={"Authorization": request.headers.get("Authorization")},
-                )
-                badge_result = (
-                    badge_response.json() if badge_response.status_code == 200 else None
-                )
-            except Exception as e:
-                badge_result = None
+            # 잔액 차감, 인증 횟수 증가, 지출 저장을 하나의 트랜잭션으로 처리
+            with transaction.atomic():
+                # 잔액 확인 및 차감
+                if not debit_balance(participant, amount):
+                    return Response(
+                        {"error": "잔액이 부족합니다"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+                # 오늘 첫 인증이면 ocr_count 및 challenge_streak 증가
+                count_daily_verification(participant, request.user, today)
 
-            # 잔액이 0 이하거나 예산을 초과한 경우 챌린지 실패 처리
-            challenge_budget = challenge.budget
-            total_spent = challenge_budget - participant.balance
+                # 지출 내역 저장
+                expense = serializer.save()
 
-            if participant.balance <= 0 or total_spent > challenge_budget:
-                participant.is_failed = 1
-                participant.save()
+                participant.refresh_from_db(fields=["balance", "ocr_count"])
 
-                # 챌린지의 모든 참가자가 실패했는지 확인
-                all_failed = not ChallengeParticipant.objects.filter(
-                    challenge=challenge, is_failed=0
-                ).exists()
+                # 잔액이 0 이하거나 예산을 초과한 경우 챌린지 실패 처리
+                challenge_budget = challenge.budget
+                total_spent = challenge_budget - participant.balance
 
-                # 모든 참가자가 실패했다면 챌린지도 종료
-                if all_failed:
-                    challenge.status = 2  # FINISHED
-                    challenge.save()
+                if participant.balance <= 0 or total_spent > challenge_budget:
+                    fail_participant(participant, challenge)
+
+            request.user.refresh_from_db(fields=["challenge_streak", "total_saving"])
+
+            # 뱃지 체크 (프로세스 내 호출)
+            badge_data = check_new_badges(request.user)
 
             return Response(
                 {
@@ -901,7 +939,7 @@ class SimpleExpenseViewSet(viewsets.ViewSet):
                     "amount": amount,
                     "remaining_balance": participant.balance,
                     "ocr_count": participant.ocr_count,
-                    "badge_result": badge_result,
+                    "badge_result": badge_data,
                 },
                 status=status.HTTP_201_CREATED,
             )
@@ -924,21 +962,14 @@ class ChallengeLikeViewSet(viewsets.ModelViewSet):
         encourage = serializer.validated_data.get("encourage", False)
         want_to_join = serializer.validated_data.get("want_to_join", False)
 
-        # 둘 다 False면 reaction 삭제
-        if not encourage and not want_to_join:
-            ChallengeLike.objects.filter(
-                challenge_id=challenge_id, user=self.request.user
-            ).delete()
-            return
-
-        # 이미 존재하는 reaction이 있다면 업데이트
-        reaction, created = ChallengeLike.objects.update_or_create(
-            challenge_id=challenge_id,
-            user=self.request.user,
-            defaults={
-                "encourage": encourage,
-                "want_to_join": want_to_join,
-            },
+        # 둘 다 False면 reaction 삭제, 아니면 생성/수정 (응원/참여희망 카운터 함께 갱신)
+        reaction = set_reaction(
+            challenge_id, self.request.user, encourage, want_to_join
         )
+        if reaction is None:
+            return
 
         serializer.instance = reaction
+
+    def perform_destroy(self, instance):
+        delete_reaction(instance)
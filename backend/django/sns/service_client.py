@@ -0,0 +1,199 @@
+import bisect
+import logging
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상 전부
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+# 재시도할 응답 코드 (일시적인 서버/게이트웨이 오류)
+RETRY_STATUS_CODES = {502, 503, 504}
+
+DEFAULT_TARGET = {
+    "timeout": (3, 10),  # (연결, 응답) 초
+    "retries": 2,
+    "backoff": 0.2,  # 재시도 대기 기본값(초), 시도마다 2배
+    "failure_threshold": 5,  # 연속 실패 시 회로 차단
+    "reset_timeout": 30,  # 차단 후 다시 시도해보기까지 대기(초)
+    "pool_maxsize": 10,
+}
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """연속 실패로 회로가 열려 호출을 시도하지 않음"""
+
+
+class CircuitBreaker:
+    """
+    연속 실패 failure_threshold회 -> open (reset_timeout 동안 즉시 실패)
+    -> half-open (한 번만 시도) -> 성공 시 closed, 실패 시 다시 open
+    """
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        with self.lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half-open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def observe(self, elapsed_ms, error=False):
+        with self.lock:
+            self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+            self.total_ms += elapsed_ms
+            self.errors += error
+
+    def snapshot(self):
+        with self.lock:
+            count = sum(self.counts)
+            labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [
+                f">{LATENCY_BUCKETS_MS[-1]}"
+            ]
+            return {
+                "count": count,
+                "errors": self.errors,
+                "avg_ms": self.total_ms / count if count else 0.0,
+                "buckets_ms": dict(zip(labels, self.counts)),
+            }
+
+
+class ServiceClient:
+    """
+    서비스 간 HTTP 호출 (대상별 keep-alive 세션, 제한 시간, 재시도, 회로 차단, 지연 시간 기록)
+    대상 설정은 settings.SERVICE_TARGETS[name]
+    """
+
+    def __init__(self, name, base_url, **options):
+        config = {**DEFAULT_TARGET, **options}
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.timeout = config["timeout"]
+        self.retries = config["retries"]
+        self.backoff = config["backoff"]
+        self.breaker = CircuitBreaker(config["failure_threshold"], config["reset_timeout"])
+        self.latency = LatencyHistogram()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config["pool_maxsize"])
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, path, data=None, **kwargs):
+        """
+        data가 호출 가능한 객체면 시도마다 호출하여 새 본문을 받음 (스트리밍 본문 재시도용)
+        재시도 후에도 실패하면 requests.RequestException (회로가 열려 있으면 CircuitOpenError)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = f"{self.base_url}/{path.lstrip('/')}"
+
+        for attempt in range(self.retries + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f"{self.name} 서비스 호출이 일시 차단되었습니다")
+
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method, url, data=data() if callable(data) else data, **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.latency.observe((time.perf_counter() - start) * 1000, error=True)
+                self.breaker.record_failure()
+                if attempt == self.retries:
+                    raise
+                logger.warning(f"{self.name} request failed ({e}), retrying")
+            except Exception:
+                # 재시도하지 않는 오류 (본문 읽기 실패, 응답 디코딩 오류 등)도 실패로 기록해야
+                # half-open 시험 호출 상태가 풀림
+                self.latency.observe((time.perf_counter() - start) * 1000, error=True)
+                self.breaker.record_failure()
+                raise
+            else:
+                failed = response.status_code >= 500
+                self.latency.observe((time.perf_counter() - start) * 1000, error=failed)
+                if failed:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+                if response.status_code not in RETRY_STATUS_CODES or attempt == self.retries:
+                    return response
+                response.close()
+                logger.warning(f"{self.name} returned {response.status_code}, retrying")
+
+            # 지수 백오프 + 지터
+            time.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def metrics(self):
+        return {
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "latency": self.latency.snapshot(),
+        }
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(name):
+    """대상별 클라이언트 (프로세스당 하나, 연결 풀 공유)"""
+    client = _clients.get(name)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(name)
+            if client is None:
+                client = ServiceClient(name, **settings.SERVICE_TARGETS[name])
+                _clients[name] = client
+    return client
+
+
+def service_metrics():
+    return {name: client.metrics() for name, client in _clients.items()}
@@ -25,6 +25,25 @@ environ.Env.read_env(os.path.join(BASE_DIR, ".env"))
 # FastAPI 서버 URL
 FASTAPI_URL = os.getenv("FASTAPI_URL", "http://fastapi-app:8001")
 
+# 서비스 간 호출 대상 (sns/service_client.py, 기본값은 DEFAULT_TARGET)
+SERVICE_TARGETS = {
+    "recommend": {
+        "base_url": os.getenv("RECOMMEND_SERVICE_URL", FASTAPI_URL),
+        "timeout": (3, 10),
+    },
+    "ocr": {
+        "base_url": os.getenv("OCR_SERVICE_URL", FASTAPI_URL),
+        "timeout": (3, 90),
+        "retries": 1,
+        "pool_maxsize": 4,
+    },
+}
+
+# 뱃지 목록 캐시 버전 키 (공유 캐시 사용 시 설정하면 프로세스 간 무효화 전파)
+BADGE_CACHE_VERSION_KEY = os.getenv("BADGE_CACHE_VERSION_KEY")
+# 챌린지 자동완성 색인 버전 키 (설정 시 다른 프로세스의 챌린지 변경도 반영)
+SUGGEST_CACHE_VERSION_KEY = os.getenv("SUGGEST_CACHE_VERSION_KEY")
+
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/3.2/howto/deployment/checklist/
 
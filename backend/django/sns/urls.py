@@ -27,6 +27,7 @@ from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework import routers, permissions
 from django.conf import settings
+from .views import service_metrics_view
 
 # from accounts.views import UserListView, UserCreateView, UserDetailView
 
@@ -54,6 +55,8 @@ urlpatterns = [
     path("api/challenges/", include("challenges.urls")),
     # 게시판 관련 URLs
     path("api/posts/", include("posts.urls")),
+    # 서비스 간 호출 지표 (관리자)
+    path("api/metrics/services/", service_metrics_view, name="service-metrics"),
 ]
 
 if settings.DEBUG:
@@ -0,0 +1,11 @@
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from .service_client import service_metrics
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def service_metrics_view(request):
+    """서비스 간 호출의 회로 상태 및 대상별 지연 시간 분포"""
+    return Response(service_metrics())
@@ -0,0 +1,106 @@
+"""
+OCR 전처리 벤치마크
+
+fixture 디렉토리의 캡처 이미지(*.png, *.jpg, *.jpeg)를 전처리 방식별로 OCR하여
+이미지당 처리 시간, 입력 배열 크기, 프로세스 최대 메모리(RSS), 텍스트 정확도를 비교
+
+정확도: 이미지와 같은 이름의 .txt 파일(정답 텍스트 한 줄에 하나)이 있으면
+        정답 줄 중 OCR 결과에서 찾은 비율 (공백 무시)
+
+사용법 (backend/fastapi 에서):
+    python -m benchmarks.ocr_preprocess <fixture_dir> [--modes raw resize crop]
+"""
+import argparse
+import io
+import multiprocessing
+import resource
+import time
+from pathlib import Path
+import numpy as np
+from PIL import Image
+from preprocessing import load_image, crop_transaction_region
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+
+
+def prepare(contents: bytes, mode: str) -> np.ndarray:
+    if mode == "raw":
+        # 전처리 도입 전 방식: 원본 해상도 RGB
+        return np.array(Image.open(io.BytesIO(contents)).convert("RGB"))
+    gray = np.asarray(load_image(contents))
+    if mode == "crop":
+        gray = crop_transaction_region(gray)
+    return gray
+
+
+def recall(expected, texts):
+    found = "".join("".join(texts).split())
+    lines = ["".join(line.split()) for line in expected if line.strip()]
+    if not lines:
+        return None
+    return sum(line in found for line in lines) / len(lines)
+
+
+def run_mode(mode, paths, results):
+    """(별도 프로세스) 한 가지 방식으로 전체 fixture OCR"""
+    from paddleocr import PaddleOCR
+
+    ocr = PaddleOCR(lang='korean', show_log=False)
+    timings, sizes, scores = [], [], []
+    for path in paths:
+        contents = path.read_bytes()
+        start = time.perf_counter()
+        array = prepare(contents, mode)
+        ocr_result = ocr.ocr(array, cls=True)
+        timings.append(time.perf_counter() - start)
+        sizes.append(array.nbytes)
+
+        texts = [line[1][0] for line in (ocr_result[0] or []) if line] if ocr_result else []
+        answer = path.with_suffix(".txt")
+        if answer.exists():
+            score = recall(answer.read_text(encoding="utf-8").splitlines(), texts)
+            if score is not None:
+                scores.append(score)
+
+    results.put({
+        "mode": mode,
+        "images": len(paths),
+        "avg_ms": float(np.mean(timings)) * 1000,
+        "p95_ms": float(np.percentile(timings, 95)) * 1000,
+        "avg_input_kb": float(np.mean(sizes)) / 1024,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "recall": float(np.mean(scores)) if scores else None,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("fixture_dir", type=Path)
+    parser.add_argument("--modes", nargs="+", default=["raw", "resize", "crop"], choices=["raw", "resize", "crop"])
+    args = parser.parse_args()
+
+    paths = sorted(p for p in args.fixture_dir.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+    if not paths:
+        parser.error(f"{args.fixture_dir}에 이미지가 없습니다")
+
+    # 방식마다 새 프로세스에서 실행해야 최대 메모리를 따로 측정할 수 있음
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    print(f"{'mode':<8}{'images':>8}{'avg_ms':>10}{'p95_ms':>10}{'input_kb':>10}{'rss_mb':>9}{'recall':>8}")
+    for mode in args.modes:
+        process = context.Process(target=run_mode, args=(mode, paths, results))
+        process.start()
+        process.join()
+        if process.exitcode != 0:
+            print(f"{mode:<8} failed (exit code {process.exitcode})")
+            continue
+        row = results.get()
+        score = "-" if row["recall"] is None else f"{row['recall']:.3f}"
+        print(
+            f"{row['mode']:<8}{row['images']:>8}{row['avg_ms']:>10.1f}{row['p95_ms']:>10.1f}"
+            f"{row['avg_input_kb']:>10.0f}{row['max_rss_mb']:>9.0f}{score:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
 import os
+import logging
+import threading
+import time
+from contextlib import contextmanager
 import mysql.connector
-from mysql.connector import Error
-import pandas as pd
-from motor.motor_asyncio import AsyncIOMotorClient
+from mysql.connector import Error, pooling
+
+logger = logging.getLogger(__name__)
 
 # 변수 이름 설정
 CATEGORY_TABLE_NAME = "UserChallengeCategory"
@@ -14,46 +18,164 @@ db_user = os.getenv("DB_USER")
 db_password = os.getenv("DB_PASSWORD")
 db_name = os.getenv("DB_NAME")
 
-# MariaDB 연결 설정
+# 커넥션 풀 설정 (mysql.connector 풀 최대 크기는 32)
+DB_POOL_SIZE = min(int(os.getenv("DB_POOL_SIZE", "5")), 32)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "5"))  # 커넥션 대기 최대 시간 (초)
+
+
+class PoolMetrics:
+    """커넥션 체크아웃 대기 시간 통계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_checkout(self, wait):
+        with self.lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_release(self):
+        with self.lock:
+            self.in_use -= 1
+
+    def record_timeout(self):
+        with self.lock:
+            self.timeouts += 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "pool_size": DB_POOL_SIZE,
+                "in_use": self.in_use,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": (
+                    self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0
+                ),
+                "max_wait_ms": self.max_wait * 1000,
+            }
+
+
+pool_metrics = PoolMetrics()
+_pool = None
+_pool_lock = threading.Lock()
+# mysql.connector 풀은 고갈 시 바로 예외를 던지므로 세마포어로 대기열을 만듦
+_pool_slots = threading.BoundedSemaphore(DB_POOL_SIZE)
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name="fastapi",
+                    pool_size=DB_POOL_SIZE,
+                    pool_reset_session=True,
+                    host=db_host,
+                    user=db_user,
+                    password=db_password,
+                    database=db_name,
+                    charset="utf8mb4",
+                )
+    return _pool
+
+
+# MariaDB 연결 (풀에서 빌려오고 with 블록이 끝나면 반납)
+@contextmanager
 def get_db_connection():
+    start = time.monotonic()
+    if not _pool_slots.acquire(timeout=DB_POOL_TIMEOUT):
+        pool_metrics.record_timeout()
+        logger.error("DB connection pool exhausted")
+        yield None
+        return
+
     try:
-        connection = mysql.connector.connect(
-            host=db_host,
-            user=db_user,
-            password=db_password,
-            database=db_name,
-            charset="utf8mb4"
-        )
-        if connection.is_connected():
-            print("Connected to MariaDB")  # 이 메시지가 콘솔에 출력되는지 확인
-            return connection
+        connection = get_pool().get_connection()
+        # 헬스 체크: 끊어진 연결이면 재연결
+        connection.ping(reconnect=True, attempts=2, delay=0)
     except Error as e:
-        print(f"Error: {e}")  # 에러가 있다면 여기서 확인 가능
-        return None
-
-# User 테이블 데이터 가져오기
-def get_users():
-    connection = get_db_connection()
-    if connection is None:
-        return []
-
-    query = f"SELECT id, sex, birth_date, career, nickname, profile_image FROM {USER_TABLE_NAME}" #nickname, profile_image는 FE로 보낼 기초 정보
-    df = pd.read_sql(query, connection)  # pandas로 데이터 가져오기
-    connection.close()
-
-    # birth_date를 연도로 변환 (나이와 연관)
-    df["birth_year"] = df["birth_date"].apply(lambda x: int(str(x)[:4]) if x else None)
-    df.drop(columns=["birth_date"], inplace=True)
-
-    return df
-
-def get_categorys(): # 카테고리 정보 가져오기
-    connection = get_db_connection()
-    if connection is None:
-        return []
-    
-    query = f"SELECT * FROM {CATEGORY_TABLE_NAME}" #카테고리 테이블 이름
-    df = pd.read_sql(query, connection)
-    connection.close()
-    print(df)
-    return df
\ No newline at end of file
+        logger.error(f"DB connection error: {e}")
+        _pool_slots.release()
+        yield None
+        return
+
+    pool_metrics.record_checkout(time.monotonic() - start)
+    try:
+        yield connection
+    finally:
+        connection.close()  # 풀에 반납
+        pool_metrics.record_release()
+        _pool_slots.release()
+
+
+CATEGORY_COLUMNS = [
+    "cafe", "restaurant", "grocery", "shopping", "culture",
+    "hobby", "drink", "transportation", "etc",
+]
+
+# 추천용 사용자 피처 가져오기 (User + UserChallengeCategory)
+def get_user_features(since_id=None, since_updated=None):
+    """
+    since_id/since_updated가 없으면 전체, 있으면 그 이후에 추가/수정된 사용자만 조회
+    반환: (id, sex, birth_date, career, updated_at, cafe, ..., etc) 튜플 리스트 (DB 연결 실패 시 None)
+    """
+    category_columns = ", ".join(f"c.{column}" for column in CATEGORY_COLUMNS)
+    columns = f"""
+        u.id, u.sex, u.birth_date, u.career,
+        GREATEST(u.updated_at, COALESCE(c.updated_at, u.updated_at)),
+        {category_columns}
+    """
+    if since_id is None:
+        query = f"""
+            SELECT {columns}
+            FROM {USER_TABLE_NAME} u
+            LEFT JOIN {CATEGORY_TABLE_NAME} c ON c.user_id = u.id
+        """
+        params = ()
+    else:
+        # OR 조건 하나로 묶으면 인덱스를 못 쓰고 전체 스캔하므로
+        # 각 조건을 인덱스(PK, updated_at)로 찾은 id를 UNION으로 합친 뒤 조인
+        query = f"""
+            SELECT {columns}
+            FROM (
+                SELECT id FROM {USER_TABLE_NAME} WHERE id > %s
+                UNION
+                SELECT id FROM {USER_TABLE_NAME} WHERE updated_at >= %s
+                UNION
+                SELECT user_id FROM {CATEGORY_TABLE_NAME} WHERE updated_at >= %s
+            ) changed
+            JOIN {USER_TABLE_NAME} u ON u.id = changed.id
+            LEFT JOIN {CATEGORY_TABLE_NAME} c ON c.user_id = u.id
+        """
+        params = (since_id, since_updated, since_updated)
+
+    with get_db_connection() as connection:
+        if connection is None:
+            return None
+        cursor = connection.cursor()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        cursor.close()
+    return rows
+
+
+# 탈퇴한 사용자 정리용 전체 사용자 id (PK 인덱스만 읽음)
+def get_user_ids():
+    """반환: 사용자 id 리스트 (DB 연결 실패 시 None)"""
+    with get_db_connection() as connection:
+        if connection is None:
+            return None
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT id FROM {USER_TABLE_NAME}")
+        rows = cursor.fetchall()
+        cursor.close()
+    return [user_id for (user_id,) in rows]
@@ -0,0 +1,235 @@
+"""
+OCR 인증 API (SERVICE_ROLE이 ocr 또는 all일 때만 로드)
+PaddleOCR 모델은 앱 시작 시 워커 프로세스에서 백그라운드로 로드
+"""
+import asyncio
+import json
+import os
+from typing import List
+import openai
+from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+import ocr_pipeline
+from ocr_pipeline import extract_texts, OCR_REQUEST_CONCURRENCY
+from result_cache import result_cache, image_key, texts_key
+from statement_parser import parse_statement
+
+router = APIRouter()
+
+client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+
+class OCRResult(BaseModel):
+    store: str
+    expense: int
+
+
+class OCRResponse(BaseModel):
+    results: List[OCRResult]
+
+
+# 업로드 전체 텍스트를 한 번에 보낼 수 있는 최대 토큰 수 (초과 시 이미지별 호출)
+LLM_TOKEN_BUDGET = int(os.getenv("LLM_TOKEN_BUDGET", "6000"))
+# 규칙 기반 파서 결과를 그대로 쓰는 최소 신뢰도 (미만이면 OpenAI 호출)
+RULE_PARSER_MIN_CONFIDENCE = float(os.getenv("RULE_PARSER_MIN_CONFIDENCE", "0.9"))
+
+SYSTEM_PROMPT = "리스트에서 조건에 맞는 텍스트를 필터링하여 구조화된 JSON 데이터로 변환하는 assistant입니다."
+
+PROMPT_RULES = """
+    # 꼭 지켜야하는 요청사항
+    1. 반드시 JSON 배열([])로 감싸야 합니다. 
+    2. JSON 코드 블록(예: ```json, ``` 등)은 절대 포함하지 마세요.
+    3. 불필요한 텍스트를 포함하지 마세요.
+    4. 출금금액(expense)은 숫자로만 반환하세요. 틀리면 안 됩니다.
+    5. 따옴표는 꼭 큰따옴표(")를 사용하세요. 작은따옴표(')를 사용하지 마세요.
+"""
+
+
+def estimate_tokens(texts: List[str]) -> int:
+    """토큰 수 대략 추정 (한글은 글자당 1토큰 이상이므로 글자 수를 상한으로 사용)"""
+    return sum(len(text) for text in texts)
+
+
+async def request_openai(prompt: str) -> list:
+    """OpenAI 호출 후 응답을 JSON 배열로 파싱"""
+    try:
+        response = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.5
+        )
+    except openai.OpenAIError as e:
+        raise HTTPException(status_code=500, detail=f"OpenAI API error: {str(e)}")
+
+    response_text = response.choices[0].message.content.strip()
+    try:
+        parsed_data = json.loads(response_text)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=500, detail="Failed to parse OpenAI response.")
+    if not isinstance(parsed_data, list):
+        raise HTTPException(status_code=500, detail="Failed to parse OpenAI response.")
+    return parsed_data
+
+
+def parse_result(item) -> OCRResult:
+    """OpenAI 응답 원소 하나를 검증 (형식이 다르면 JSON 파싱 실패와 같은 500 응답)"""
+    try:
+        return OCRResult(**item)
+    except (ValidationError, TypeError):
+        raise HTTPException(status_code=500, detail="Failed to parse OpenAI response.")
+
+
+async def cached_results(key: str, request) -> List[OCRResult]:
+    """같은 텍스트에 대한 변환 결과가 캐시에 있으면 OpenAI를 호출하지 않음"""
+    parsed_data = await run_in_threadpool(result_cache.get, key)
+    if parsed_data is None:
+        parsed_data = [parse_result(item).model_dump() for item in await request()]
+        await run_in_threadpool(result_cache.put, key, parsed_data)
+    return [OCRResult(**item) for item in parsed_data]
+
+
+async def process_with_openai(arr: List[str]) -> List[OCRResult]:
+    """OpenAI API를 활용하여 이미지 한 장의 OCR 결과를 JSON 형태로 변환"""
+    if not arr:
+        raise HTTPException(status_code=400, detail="No text extracted from images.")
+
+    prompt = f"""
+    다음 리스트는 OCR을 통해 은행 어플 입출금 내역 텍스트 데이터 입니다.
+
+    다음 리스트에서 출금내용(store), 출금금액(expense)을 JSON형식으로 반환하세요.  
+    출력은 **반드시 하나의 JSON** 형태여야 합니다. 
+    출금 내역을 누락하지 않도록 하세요. 또한 존재하지 않는 출금 내역을 중복해서 추출하지 마세요.
+    {PROMPT_RULES}
+    리스트:
+    {arr}
+    """
+
+    return await cached_results(
+        texts_key([arr]), lambda: request_openai(prompt)
+    )
+
+
+async def process_batch_with_openai(texts_by_image: List[List[str]]) -> List[List[OCRResult]]:
+    """
+    여러 이미지의 OCR 결과를 이미지 번호(image)로 구분해 한 번의 호출로 변환
+    반환: 입력 순서대로 이미지별 결과 리스트
+    """
+    key = texts_key(texts_by_image)
+    grouped = await run_in_threadpool(result_cache.get, key)
+    if grouped is None:
+        tagged = [
+            {"image": index, "texts": texts}
+            for index, texts in enumerate(texts_by_image)
+        ]
+
+        prompt = f"""
+    다음 JSON 배열은 여러 장의 은행 어플 입출금 내역 캡처를 OCR한 텍스트 데이터 입니다.
+    각 원소의 image는 캡처 번호, texts는 해당 캡처에서 추출한 텍스트 리스트입니다.
+
+    모든 캡처에서 출금내용(store), 출금금액(expense)을 찾아 캡처 번호(image)와 함께 JSON형식으로 반환하세요.
+    예: [{{"image": 0, "store": "가게", "expense": 1000}}]
+    출력은 **반드시 하나의 JSON** 형태여야 합니다. 
+    출금 내역을 누락하지 않도록 하세요. 또한 존재하지 않는 출금 내역을 중복해서 추출하지 마세요.
+    {PROMPT_RULES}
+    데이터:
+    {json.dumps(tagged, ensure_ascii=False)}
+    """
+
+        grouped = [[] for _ in texts_by_image]
+        for item in await request_openai(prompt):
+            index = item.pop("image", 0) if isinstance(item, dict) else None
+            if not isinstance(index, int) or not 0 <= index < len(grouped):
+                raise HTTPException(status_code=500, detail="Failed to parse OpenAI response.")
+            grouped[index].append(parse_result(item).model_dump())
+        await run_in_threadpool(result_cache.put, key, grouped)
+
+    return [[OCRResult(**item) for item in results] for results in grouped]
+
+
+@router.post("/extract_text/", response_model=OCRResponse)
+async def extract_text(files: List[UploadFile] = File(None, alias="files")):
+    """여러 장의 이미지에서 텍스트를 추출하여 단일 JSON으로 반환"""
+    if not files:
+        raise HTTPException(status_code=400, detail="No files uploaded.")
+
+    # 요청 하나에서 동시에 처리하는 이미지 수 제한
+    semaphore = asyncio.Semaphore(OCR_REQUEST_CONCURRENCY)
+
+    async def ocr_file(file: UploadFile) -> List[str]:
+        async with semaphore:
+            try:
+                contents = await file.read()
+                # 같은 캡처를 다시 올린 경우 OCR 생략
+                key = image_key(contents)
+                texts = await run_in_threadpool(result_cache.get, key)
+                if texts is None:
+                    texts = await extract_texts(contents)
+                    await run_in_threadpool(result_cache.put, key, texts)
+                return texts
+
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"OCR processing failed for {file.filename}: {str(e)}")
+
+    texts_by_image = await asyncio.gather(*(ocr_file(file) for file in files))
+    if not any(texts_by_image):
+        raise HTTPException(status_code=400, detail="No text extracted from images.")
+
+    # 규칙 기반 파서로 충분히 확실하게 읽힌 이미지는 OpenAI 호출 생략
+    results_by_image = [[] for _ in texts_by_image]
+    llm_indices = []
+    for index, texts in enumerate(texts_by_image):
+        if not texts:
+            continue
+        parsed, confidence = parse_statement(texts)
+        if confidence >= RULE_PARSER_MIN_CONFIDENCE:
+            results_by_image[index] = [OCRResult(**item) for item in parsed]
+        else:
+            llm_indices.append(index)
+
+    if llm_indices:
+        llm_texts = [texts_by_image[index] for index in llm_indices]
+        # 전체 텍스트가 토큰 한도 안이면 한 번의 호출로, 넘으면 이미지별로 나눠 호출
+        if len(llm_texts) > 1 and estimate_tokens([text for texts in llm_texts for text in texts]) <= LLM_TOKEN_BUDGET:
+            grouped = await process_batch_with_openai(llm_texts)
+        else:
+            grouped = await asyncio.gather(*(process_with_openai(texts) for texts in llm_texts))
+        for index, results in zip(llm_indices, grouped):
+            results_by_image[index] = results
+
+    # 이미지별 결과를 업로드 순서대로 하나의 OCRResponse 객체로 반환
+    all_results = [item for results in results_by_image for item in results]
+    return OCRResponse(results=all_results)
+
+
+@router.get("/metrics/ocr")
+def ocr_metrics():
+    """OCR 워커별 대기 작업 수 및 배치 처리 시간"""
+    return ocr_pipeline.worker_pool.metrics()
+
+
+@router.get("/metrics/cache")
+def cache_metrics():
+    """OCR / OpenAI 결과 캐시 항목 수 및 적중률"""
+    return result_cache.stats()
+
+
+async def startup():
+    # OCR 워커를 미리 띄워 첫 요청 전에 모델 로드 (시작을 기다리지 않음)
+    ocr_pipeline.start()
+
+
+async def shutdown():
+    ocr_pipeline.shutdown()
+
+
+def readiness():
+    workers = ocr_pipeline.worker_pool.workers
+    return {
+        "ready": ocr_pipeline.worker_pool.ready,
+        "workers": len(workers),
+        "warm_workers": sum(worker.ready for worker in workers),
+    }
@@ -0,0 +1,247 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from typing import List
+from preprocessing import preprocess
+
+logger = logging.getLogger(__name__)
+
+# OCR 워커 프로세스 수 (기본: CPU 수의 절반, paddle이 프로세스 안에서도 여러 스레드를 사용)
+OCR_PROCESSES = int(os.getenv("OCR_PROCESSES", str(max(1, (os.cpu_count() or 2) // 2))))
+# 요청 하나에서 동시에 처리할 이미지 수
+OCR_REQUEST_CONCURRENCY = int(os.getenv("OCR_REQUEST_CONCURRENCY", "4"))
+# 마이크로 배치: 이 시간(ms) 동안 들어온 이미지를 모아 한 워커에 한 번에 전달
+OCR_BATCH_WINDOW_MS = int(os.getenv("OCR_BATCH_WINDOW_MS", "20"))
+OCR_MAX_BATCH = int(os.getenv("OCR_MAX_BATCH", "8"))
+# 이미지 한 장의 OCR 결과를 기다리는 최대 시간 (초, 워커가 멈춰도 요청이 끝없이 대기하지 않도록)
+OCR_JOB_TIMEOUT = float(os.getenv("OCR_JOB_TIMEOUT", "60"))
+
+
+class OCRWorkerError(Exception):
+    pass
+
+
+def _extract_texts(ocr, contents: bytes) -> List[str]:
+    """이미지 바이트에서 텍스트 라인 추출"""
+    ocr_result = ocr.ocr(preprocess(contents), cls=True)
+    if not ocr_result or not ocr_result[0]:
+        return []
+    return [line[1][0] for line in ocr_result[0] if line]
+
+
+def _worker_main(worker_id, jobs, results):
+    """
+    (워커 프로세스) 모델을 한 번 로드한 뒤 배치 단위로 OCR 수행
+    jobs: [(job_id, contents), ...] 배치, results: ("ready"|"done", worker_id, payload)
+    """
+    from paddleocr import PaddleOCR
+
+    ocr = PaddleOCR(lang='korean')  # 한국어 설정
+    results.put(("ready", worker_id, None))
+
+    while True:
+        batch = jobs.get()
+        if batch is None:
+            break
+        start = time.monotonic()
+        outputs = []
+        for job_id, contents in batch:
+            try:
+                outputs.append((job_id, True, _extract_texts(ocr, contents)))
+            except Exception as e:
+                outputs.append((job_id, False, str(e)))
+        results.put(("done", worker_id, (outputs, time.monotonic() - start)))
+
+
+class WorkerState:
+    def __init__(self, worker_id, context, results):
+        self.worker_id = worker_id
+        self.jobs = context.Queue()
+        self.process = context.Process(
+            target=_worker_main, args=(worker_id, self.jobs, results), daemon=True
+        )
+        self.ready = False
+        self.in_flight = {}  # job_id -> future
+        self.batches = 0
+        self.images = 0
+        self.total_seconds = 0.0
+        self.last_seconds = 0.0
+
+    def metrics(self):
+        return {
+            "worker_id": self.worker_id,
+            "alive": self.process.is_alive(),
+            "ready": self.ready,
+            "queue_depth": len(self.in_flight),
+            "batches": self.batches,
+            "images": self.images,
+            "avg_batch_ms": (
+                self.total_seconds / self.batches * 1000 if self.batches else 0.0
+            ),
+            "last_batch_ms": self.last_seconds * 1000,
+        }
+
+
+class OCRWorkerPool:
+    """
+    모델을 미리 로드한 N개의 OCR 워커 프로세스
+    - submit()으로 들어온 이미지를 OCR_BATCH_WINDOW_MS 동안 모아(여러 사용자 요청 포함)
+      대기 중인 작업이 가장 적은 워커에 한 번에 전달
+    - 워커가 비정상 종료되면 처리 중이던 작업을 실패시키고 새 워커로 교체
+    """
+
+    def __init__(self, size=OCR_PROCESSES):
+        self.size = size
+        # paddle은 fork 이후 동작이 불안정하므로 spawn으로 워커 생성
+        self.context = multiprocessing.get_context("spawn")
+        self.results = self.context.Queue()
+        self.workers = []
+        self.job_ids = itertools.count()
+        self.pending = []
+        self.flush_handle = None
+        self.lock = threading.Lock()
+        self.loop = None
+        self.reader = None
+        self.running = False
+
+    def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.running = True
+        self.workers = [self._spawn(worker_id) for worker_id in range(self.size)]
+        self.reader = threading.Thread(target=self._read_results, daemon=True)
+        self.reader.start()
+
+    def _spawn(self, worker_id):
+        worker = WorkerState(worker_id, self.context, self.results)
+        worker.process.start()
+        return worker
+
+    def stop(self):
+        self.running = False
+        for worker in self.workers:
+            worker.jobs.put(None)
+        for worker in self.workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+
+    @property
+    def ready(self):
+        return bool(self.workers) and all(worker.ready for worker in self.workers)
+
+    async def submit(self, contents: bytes) -> List[str]:
+        job_id = next(self.job_ids)
+        future = self.loop.create_future()
+        self.pending.append((job_id, contents, future))
+        if len(self.pending) >= OCR_MAX_BATCH:
+            self._flush()
+        elif self.flush_handle is None:
+            self.flush_handle = self.loop.call_later(
+                OCR_BATCH_WINDOW_MS / 1000, self._flush
+            )
+        try:
+            return await asyncio.wait_for(future, OCR_JOB_TIMEOUT)
+        except asyncio.TimeoutError:
+            with self.lock:
+                for worker in self.workers:
+                    worker.in_flight.pop(job_id, None)
+            raise OCRWorkerError("OCR timed out")
+
+    def _flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+
+        with self.lock:
+            alive = [w for w in self.workers if w.process.is_alive()] or self.workers
+            worker = min(alive, key=lambda w: len(w.in_flight))
+            for job_id, _, future in batch:
+                worker.in_flight[job_id] = future
+        worker.jobs.put([(job_id, contents) for job_id, contents, _ in batch])
+
+    def _read_results(self):
+        """(스레드) 워커 결과를 받아 이벤트 루프의 future에 전달"""
+        while self.running:
+            # 결과가 계속 들어오는 동안에도 죽은 워커를 찾아 처리 중이던 작업을 실패시킴
+            self._replace_dead_workers()
+            try:
+                kind, worker_id, payload = self.results.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            worker = self.workers[worker_id]
+            if kind == "ready":
+                worker.ready = True
+                logger.info(f"OCR worker {worker_id} ready")
+                continue
+
+            outputs, seconds = payload
+            with self.lock:
+                worker.batches += 1
+                worker.images += len(outputs)
+                worker.total_seconds += seconds
+                worker.last_seconds = seconds
+                futures = [
+                    (worker.in_flight.pop(job_id, None), ok, value)
+                    for job_id, ok, value in outputs
+                ]
+            for future, ok, value in futures:
+                if future is not None:
+                    self.loop.call_soon_threadsafe(self._resolve, future, ok, value)
+
+    def _replace_dead_workers(self):
+        for worker_id, worker in enumerate(self.workers):
+            if worker.process.is_alive() or not self.running:
+                continue
+            logger.error(f"OCR worker {worker_id} died, restarting")
+            with self.lock:
+                failed = list(worker.in_flight.values())
+                worker.in_flight.clear()
+                self.workers[worker_id] = self._spawn(worker_id)
+            for future in failed:
+                self.loop.call_soon_threadsafe(
+                    self._resolve, future, False, "OCR worker crashed"
+                )
+
+    @staticmethod
+    def _resolve(future, ok, value):
+        if future.done():
+            return
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(OCRWorkerError(value))
+
+    def metrics(self):
+        with self.lock:
+            return {
+                "workers": [worker.metrics() for worker in self.workers],
+                "pending": len(self.pending),
+                "batch_window_ms": OCR_BATCH_WINDOW_MS,
+                "max_batch": OCR_MAX_BATCH,
+            }
+
+
+worker_pool = OCRWorkerPool()
+
+
+def start():
+    """워커 프로세스를 미리 띄워 모델 로드 (앱 시작 시 호출)"""
+    worker_pool.start()
+
+
+def shutdown():
+    worker_pool.stop()
+
+
+async def extract_texts(contents: bytes) -> List[str]:
+    """OCR 추론을 워커 프로세스에서 실행 (이벤트 루프를 막지 않음)"""
+    return await worker_pool.submit(contents)
@@ -0,0 +1,51 @@
+import io
+import os
+import numpy as np
+from PIL import Image
+
+# OCR 전 이미지 축소 기준 (긴 변 픽셀 수, 0이면 축소하지 않음)
+OCR_MAX_DIMENSION = int(os.getenv("OCR_MAX_DIMENSION", "1600"))
+# 상태바/하단 탭 등 내역 목록 바깥 영역 자르기 여부
+OCR_CROP = os.getenv("OCR_CROP", "false").lower() == "true"
+# 자를 때 위/아래에서 항상 제외할 비율 (앱 헤더, 하단 탭 높이)
+OCR_CROP_TOP = float(os.getenv("OCR_CROP_TOP", "0"))
+OCR_CROP_BOTTOM = float(os.getenv("OCR_CROP_BOTTOM", "0"))
+# 이 값보다 픽셀 편차가 작은 줄은 글자가 없는 여백으로 간주
+BLANK_ROW_STD = 4.0
+
+
+def load_image(contents: bytes, max_dimension=OCR_MAX_DIMENSION) -> Image.Image:
+    """
+    업로드 이미지를 흑백으로 디코딩하고 긴 변을 max_dimension 이하로 축소
+    JPEG는 draft()로 디코딩 단계에서 바로 축소하여 원본 해상도 버퍼를 만들지 않음
+    """
+    image = Image.open(io.BytesIO(contents))
+    if max_dimension:
+        image.draft("L", (max_dimension, max_dimension))
+    image = image.convert("L")
+    if max_dimension and max(image.size) > max_dimension:
+        image.thumbnail((max_dimension, max_dimension), Image.BILINEAR)
+    return image
+
+
+def crop_transaction_region(gray: np.ndarray, top=OCR_CROP_TOP, bottom=OCR_CROP_BOTTOM) -> np.ndarray:
+    """
+    내역 목록 영역만 남기도록 자르기
+    - 위/아래 고정 비율(앱 헤더, 하단 탭) 제외
+    - 남은 영역의 위/아래 끝에서 글자가 없는(편차가 거의 없는) 줄 제거
+    """
+    height = gray.shape[0]
+    gray = gray[int(height * top):height - int(height * bottom)]
+
+    content_rows = np.flatnonzero(gray.std(axis=1) > BLANK_ROW_STD)
+    if content_rows.size == 0:
+        return gray
+    return gray[content_rows[0]:content_rows[-1] + 1]
+
+
+def preprocess(contents: bytes, crop=OCR_CROP) -> np.ndarray:
+    """OCR 입력용 흑백 배열 생성 (PaddleOCR은 2차원 배열을 받으면 내부에서 3채널로 변환)"""
+    gray = np.asarray(load_image(contents))
+    if crop:
+        gray = crop_transaction_region(gray)
+    return gray
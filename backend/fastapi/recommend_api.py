@@ -0,0 +1,90 @@
+"""
+사용자 추천 API (SERVICE_ROLE이 recommend 또는 all일 때만 로드)
+사용자 피처는 앱 시작 후 백그라운드에서 전체 로드하고 주기적으로 증분 갱신
+"""
+import asyncio
+import logging
+import os
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from recommender import feature_store, RECOMMENDED_PERSON_NUM
+from database import pool_metrics
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# 추천 피처 증분 갱신 주기 (초)
+FEATURE_REFRESH_SECONDS = int(os.getenv("FEATURE_REFRESH_SECONDS", "30"))
+
+refresh_task = None
+
+
+async def load_and_refresh_features():
+    # 전체 로드가 실패하면 다음 주기에 refresh()가 다시 전체 로드
+    try:
+        await run_in_threadpool(feature_store.load)
+    except Exception as e:
+        logger.error(f"Feature store load failed: {e}")
+    while True:
+        await asyncio.sleep(FEATURE_REFRESH_SECONDS)
+        try:
+            await run_in_threadpool(feature_store.refresh)
+        except Exception as e:
+            logger.error(f"Feature store refresh failed: {e}")
+
+
+async def startup():
+    global refresh_task
+    refresh_task = asyncio.create_task(load_and_refresh_features())
+
+
+async def shutdown():
+    if refresh_task is not None:
+        refresh_task.cancel()
+
+
+def readiness():
+    return {"ready": feature_store.loaded, "users": feature_store.size}
+
+
+### FE에서 받아오는 데이터 형식 ###
+#### 사용자 추천 ####
+class RecommendRequest(BaseModel): # 추천 시 사용자 id 받음
+    id: int
+
+
+@router.get("/metrics/db")
+def db_metrics():
+    """DB 커넥션 풀 사용량 및 체크아웃 대기 시간"""
+    return pool_metrics.snapshot()
+
+
+### 사용자 추천 기능 ###
+
+@router.post("/api/accounts/recommendations")  # URL 경로 수정
+async def recommend(request: RecommendRequest):
+    """
+    추천의 기본이 되는 사용자 아이디를 받으면 해당 사용자와 유사한 순서대로 사용자 아이디 반환
+    """
+    if not feature_store.loaded:
+        raise HTTPException(status_code=503, detail="User features are still loading")
+
+    # 기준이 될 사용자
+    TARGET = request.id
+
+    # 가입 직후 사용자 등 아직 반영되지 않은 경우 증분 갱신 후 재확인
+    if TARGET not in feature_store or not feature_store.has_categories(TARGET):
+        await run_in_threadpool(feature_store.refresh)
+
+    if feature_store.size == 0:
+        raise HTTPException(status_code=500, detail="No user data available")
+
+    if TARGET not in feature_store:
+        raise HTTPException(status_code=404, detail="Target user not found")
+
+    if not feature_store.has_categories(TARGET):
+        raise HTTPException(status_code=404, detail="Target user category not found")
+
+    return feature_store.recommend(TARGET, RECOMMENDED_PERSON_NUM)
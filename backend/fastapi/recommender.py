@@ -0,0 +1,253 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from database import CATEGORY_COLUMNS, get_user_features, get_user_ids
+
+### 변수 설정 ###
+RECOMMENDED_PERSON_NUM = 10  # 추천하는 사용자 수
+RECOMMEND_CACHE_SIZE = int(os.getenv("RECOMMEND_CACHE_SIZE", "1024"))  # 캐시할 사용자 수
+RECOMMEND_CACHE_TTL = int(os.getenv("RECOMMEND_CACHE_TTL", "300"))  # 캐시 유지 시간 (초)
+# 탈퇴한 사용자를 찾아 제거하는 주기 (초, 증분 갱신은 추가/수정만 반영하므로 별도 확인)
+USER_SWEEP_SECONDS = int(os.getenv("USER_SWEEP_SECONDS", "300"))
+
+# 유저 정보 피처 가중치 (sex, birth_year, career)
+USER_FEATURE_WEIGHTS = np.array([0.2, 0.5, 0.3])
+# 카테고리 유사도 - 유저 정보 유사도 가중치
+FINAL_WEIGHTS = (0.5, 0.5)
+
+SEX_MAP = {"M": 0.0, "F": 1.0}
+NUM_CATEGORIES = len(CATEGORY_COLUMNS)
+# 점수 행렬 열 구성: [정규화된 카테고리 9열 | 정규화된 가중 유저 피처 3열]
+NUM_COLUMNS = NUM_CATEGORIES + len(USER_FEATURE_WEIGHTS)
+COLUMN_WEIGHTS = np.concatenate(
+    (
+        np.full(NUM_CATEGORIES, FINAL_WEIGHTS[0]),
+        np.full(len(USER_FEATURE_WEIGHTS), FINAL_WEIGHTS[1]),
+    )
+)
+
+
+def _normalize(rows):
+    """행 단위 L2 정규화 (0 벡터는 0으로 유지 -> 코사인 유사도 0)"""
+    norms = np.linalg.norm(rows, axis=-1, keepdims=True)
+    return np.divide(rows, norms, out=np.zeros_like(rows), where=norms > 0)
+
+
+class RecommendationCache:
+    """사용자별 추천 결과 LRU 캐시 (TTL이 지나거나 무효화되면 다시 계산)"""
+
+    def __init__(self, max_size=RECOMMEND_CACHE_SIZE, ttl=RECOMMEND_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def invalidate(self, user_id):
+        # 캐시 키는 (user_id, count)
+        for key in [key for key in self.entries if key[0] == user_id]:
+            del self.entries[key]
+
+
+class UserFeatureStore:
+    """
+    추천용 사용자 피처를 메모리에 상주시키는 저장소
+    - ids: 사용자 id, index: id -> 행 번호
+    - sex / birth_year / career: 원본 피처 열
+    - categories: 9비트 카테고리 비트마스크 (cafe=bit0 ... etc=bit8)
+    - matrix: 가중치와 정규화를 미리 적용한 점수 행렬 (C-연속 배열)
+    사용자 한 명의 추천 점수는 matrix @ matrix[target] 한 번으로 계산됩니다.
+    """
+
+    COLUMNS = ("ids", "sex", "birth_year", "career", "categories", "has_category")
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.index = {}
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.sex = np.zeros(capacity)
+        self.birth_year = np.zeros(capacity)
+        self.career = np.zeros(capacity)
+        self.categories = np.zeros(capacity, dtype=np.uint16)
+        self.has_category = np.zeros(capacity, dtype=bool)
+        self.matrix = np.zeros((capacity, NUM_COLUMNS))
+        self.max_id = None
+        self.max_updated = None
+        self.loaded = False  # 전체 로드 완료 여부 (readiness)
+        self.swept_at = 0.0  # 마지막 탈퇴 사용자 정리 시각 (monotonic)
+        self.lock = threading.Lock()
+        self.cache = RecommendationCache()
+
+    def _grow(self, needed):
+        capacity = len(self.ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        matrix = np.zeros((capacity, NUM_COLUMNS))
+        matrix[: self.size] = self.matrix[: self.size]
+        self.matrix = matrix
+
+    def upsert(self, rows):
+        """DB 조회 결과를 반영 (새 사용자는 추가, 기존 사용자는 해당 행만 갱신)"""
+        if not rows:
+            return 0
+        with self.lock:
+            self._grow(self.size + len(rows))
+            positions = []
+            for user_id, sex, birth_date, career, updated_at, *flags in rows:
+                position = self.index.get(user_id)
+                if position is None:
+                    position = self.size
+                    self.index[user_id] = position
+                    self.size += 1
+                self.ids[position] = user_id
+                self.sex[position] = SEX_MAP.get(sex, 0.0)
+                self.birth_year[position] = int(str(birth_date)[:4]) if birth_date else 0
+                self.career[position] = career or 0
+                self.categories[position] = sum(
+                    1 << bit for bit, flag in enumerate(flags) if flag
+                )
+                self.has_category[position] = flags[0] is not None
+                positions.append(position)
+                # 프로필/카테고리가 바뀐 사용자의 추천 결과는 다시 계산
+                self.cache.invalidate(user_id)
+
+                if self.max_id is None or user_id > self.max_id:
+                    self.max_id = user_id
+                if updated_at and (self.max_updated is None or updated_at > self.max_updated):
+                    self.max_updated = updated_at
+
+            self._rebuild_rows(np.array(positions))
+        return len(rows)
+
+    def remove(self, user_ids):
+        """사용자 제거 (마지막 행을 빈자리로 옮겨 배열을 연속으로 유지)"""
+        removed = 0
+        with self.lock:
+            for user_id in user_ids:
+                position = self.index.pop(user_id, None)
+                if position is None:
+                    continue
+                last = self.size - 1
+                if position != last:
+                    for name in self.COLUMNS:
+                        column = getattr(self, name)
+                        column[position] = column[last]
+                    self.matrix[position] = self.matrix[last]
+                    self.index[int(self.ids[position])] = position
+                self.size -= 1
+                removed += 1
+            if removed:
+                # 제거된 사용자가 다른 사용자의 캐시된 추천 결과에 있을 수 있음
+                self.cache.clear()
+        return removed
+
+    def sweep_deleted(self):
+        """DB에 없는 (탈퇴한) 사용자를 저장소에서 제거"""
+        user_ids = get_user_ids()
+        if user_ids is None:
+            raise ConnectionError("Failed to load user ids")
+        self.swept_at = time.monotonic()
+        return self.remove(set(self.index) - set(user_ids))
+
+    def _rebuild_rows(self, positions):
+        bits = (
+            self.categories[positions, None] >> np.arange(NUM_CATEGORIES, dtype=np.uint16)
+        ) & 1
+        user_features = np.column_stack(
+            (self.sex[positions], self.birth_year[positions], self.career[positions])
+        ) * USER_FEATURE_WEIGHTS
+        self.matrix[positions] = (
+            np.hstack((_normalize(bits.astype(float)), _normalize(user_features)))
+            * COLUMN_WEIGHTS
+        )
+
+    def load(self):
+        """전체 사용자 피처 로드"""
+        rows = get_user_features()
+        if rows is None:
+            raise ConnectionError("Failed to load user features")
+        count = self.upsert(rows)
+        self.loaded = True
+        self.swept_at = time.monotonic()
+        return count
+
+    def refresh(self):
+        """
+        마지막 id / 수정 시각 이후에 추가·수정된 사용자만 반영
+        USER_SWEEP_SECONDS마다 탈퇴한 사용자도 제거
+        """
+        if not self.loaded:
+            return self.load()
+        count = self.upsert(get_user_features(self.max_id, self.max_updated))
+        if time.monotonic() - self.swept_at >= USER_SWEEP_SECONDS:
+            self.sweep_deleted()
+        return count
+
+    def __contains__(self, user_id):
+        return user_id in self.index
+
+    def has_categories(self, user_id):
+        return bool(self.has_category[self.index[user_id]])
+
+    def scores(self, user_id):
+        """
+        대상 사용자와 전체 사용자의 유사도 점수
+        = 0.5 * 카테고리 코사인 유사도 + 0.5 * 가중 유저 피처 코사인 유사도
+        """
+        matrix = self.matrix[: self.size]
+        target = matrix[self.index[user_id]] / COLUMN_WEIGHTS
+        return matrix @ target
+
+    def recommend(self, user_id, count=RECOMMENDED_PERSON_NUM):
+        """유사도가 높은 순서대로 사용자 id와 유사도 반환 (자기 자신 제외)"""
+        with self.lock:
+            cached = self.cache.get((user_id, count))
+            if cached is not None:
+                return cached
+
+            scores = self.scores(user_id)
+            ids = self.ids[: self.size]
+            scores[self.index[user_id]] = -np.inf
+
+            # 전체 정렬 대신 argpartition으로 상위 count개만 선택 후 정렬
+            limit = min(count, self.size - 1)
+            if limit <= 0:
+                return []
+            top = np.argpartition(-scores, limit - 1)[:limit]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            result = [
+                {"id": int(ids[i]), "similarity": float(scores[i])} for i in top
+            ]
+            self.cache.put((user_id, count), result)
+            return result
+
+
+feature_store = UserFeatureStore()
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import List
+
+# 같은 캡처를 다시 올렸을 때 OCR / OpenAI 호출을 건너뛰기 위한 디스크 캐시
+RESULT_CACHE_PATH = os.getenv(
+    "RESULT_CACHE_PATH", os.path.join(tempfile.gettempdir(), "challengobi_results.sqlite3")
+)
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "10000"))
+RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", str(7 * 24 * 3600)))  # 초
+
+
+def image_key(contents: bytes) -> str:
+    """이미지 바이트의 SHA-256 (OCR 텍스트 캐시 키)"""
+    return "ocr:" + hashlib.sha256(contents).hexdigest()
+
+
+def normalize_texts(texts: List[str]) -> List[str]:
+    """공백 차이로 캐시가 빗나가지 않도록 텍스트 정규화"""
+    return [" ".join(text.split()) for text in texts]
+
+
+def texts_key(texts_by_image: List[List[str]]) -> str:
+    """정규화한 텍스트 리스트의 SHA-256 (OpenAI 결과 캐시 키)"""
+    normalized = [normalize_texts(texts) for texts in texts_by_image]
+    payload = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+    return "llm:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    sqlite3 기반 키-값 캐시
+    - 저장 후 ttl초가 지난 항목은 만료
+    - 항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    """
+
+    def __init__(self, path=RESULT_CACHE_PATH, max_entries=RESULT_CACHE_MAX_ENTRIES, ttl=RESULT_CACHE_TTL):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.conn = None
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS result_cache_accessed_at ON result_cache (accessed_at)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS result_cache_created_at ON result_cache (created_at)"
+            )
+        return self.conn
+
+    def get(self, key: str):
+        now = time.time()
+        with self.lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM result_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now - self.ttl:
+                if row is not None:
+                    conn.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            conn.execute(
+                "UPDATE result_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value):
+        now = time.time()
+        with self.lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO result_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn, now):
+        conn.execute("DELETE FROM result_cache WHERE created_at < ?", (now - self.ttl,))
+        (count,) = conn.execute("SELECT COUNT(*) FROM result_cache").fetchone()
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM result_cache WHERE key IN ("
+                "SELECT key FROM result_cache ORDER BY accessed_at LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def stats(self):
+        with self.lock:
+            (count,) = self._connect().execute("SELECT COUNT(*) FROM result_cache").fetchone()
+            return {
+                "entries": count,
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+result_cache = ResultCache()
@@ -0,0 +1,97 @@
+"""
+은행 어플 입출금 내역 OCR 텍스트를 규칙 기반으로 파싱
+- 금액: "-4,500원", "4,500원", "출금 4,500원", "+1,000" 등
+- 출금 여부: 금액 부호(-), "출금"/"결제"/"지출" 표시
+- 가게명: 금액 바로 앞에 나온 (날짜/시간/표시어가 아닌) 텍스트 줄
+신뢰도가 낮으면 호출하는 쪽에서 OpenAI로 넘김
+"""
+import re
+from typing import List, Tuple
+
+WITHDRAW_MARKERS = ("출금", "결제", "지출")
+DEPOSIT_MARKERS = ("입금", "환불", "이자")
+BALANCE_MARKERS = ("잔액", "잔고")
+
+MARKER_RE = re.compile("|".join(WITHDRAW_MARKERS + DEPOSIT_MARKERS))
+# 부호, 천 단위 콤마 또는 "원" 중 하나는 있어야 금액으로 인정 (연도 등 숫자 오인식 방지)
+AMOUNT_RE = re.compile(r"([+-])?(\d{1,3}(?:,\d{3})+|\d+)(원)?")
+DATETIME_RE = re.compile(
+    r"(\d{2,4}[./-]\d{1,2}([./-]\d{1,2})?\.?|\d{1,2}:\d{2}(:\d{2})?|\([월화수목금토일]\))+"
+)
+
+
+def parse_amount(line: str):
+    """금액 줄이면 (부호, 금액, 표시어 방향) 반환, 아니면 None"""
+    compact = line.replace(" ", "")
+    marker = MARKER_RE.search(compact)
+    direction = None
+    if marker:
+        direction = "out" if marker.group() in WITHDRAW_MARKERS else "in"
+        compact = MARKER_RE.sub("", compact)
+
+    match = AMOUNT_RE.fullmatch(compact)
+    if not match:
+        return None
+    sign, digits, won = match.groups()
+    if not (sign or won or "," in digits or marker):
+        return None
+    if sign == "-":
+        direction = "out"
+    elif sign == "+":
+        direction = "in"
+    return direction, int(digits.replace(",", ""))
+
+
+def parse_statement(texts: List[str]) -> Tuple[List[dict], float]:
+    """
+    OCR 텍스트 리스트에서 출금 내역 추출
+    반환: ([{"store", "expense"}, ...], 신뢰도 0~1)
+    """
+    results = []
+    scores = []
+    store = None
+    pending = None  # 금액 앞 줄에 따로 나온 "출금"/"입금" 표시
+    after_amount = False  # 방금 금액을 읽음 (바로 다음의 부호 없는 금액은 잔액)
+
+    for raw in texts:
+        line = raw.strip()
+        if not line or DATETIME_RE.fullmatch(line.replace(" ", "")):
+            continue
+        if any(marker in line for marker in BALANCE_MARKERS):
+            after_amount = False
+            continue
+        if line in WITHDRAW_MARKERS + DEPOSIT_MARKERS:
+            pending = "out" if line in WITHDRAW_MARKERS else "in"
+            continue
+
+        amount = parse_amount(line)
+        if amount is None:
+            store = line
+            after_amount = False
+            continue
+
+        direction, expense = amount
+        direction = direction or pending
+        if direction is None and after_amount:
+            # 거래 금액 바로 아래 부호 없는 금액은 잔액으로 간주
+            after_amount = False
+            continue
+
+        if direction == "out" and store:
+            results.append({"store": store, "expense": expense})
+            scores.append(1.0)
+        elif direction is None and store:
+            # 출금/입금 구분이 없는 금액은 출금으로 두되 신뢰도를 낮춤
+            results.append({"store": store, "expense": expense})
+            scores.append(0.5)
+        elif direction != "in":
+            # 가게명을 찾지 못한 금액
+            scores.append(0.0)
+
+        store = None
+        pending = None
+        after_amount = True
+
+    if not scores:
+        return results, 0.0
+    return results, sum(scores) / len(scores)
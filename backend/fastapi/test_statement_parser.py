@@ -0,0 +1,145 @@
+"""
+규칙 기반 입출금 내역 파서 테스트 (python -m unittest test_statement_parser)
+파서가 OpenAI 호출 생략 여부를 결정하므로 지원하는 레이아웃별 결과와 신뢰도를 확인
+"""
+import asyncio
+import os
+import unittest
+from unittest import mock
+from statement_parser import parse_statement
+
+# (설명, OCR 텍스트, 기대 결과, 기대 신뢰도)
+CASES = [
+    (
+        "부호 있는 금액",
+        ["스타벅스", "-4,500원", "GS25", "-1,200원"],
+        [{"store": "스타벅스", "expense": 4500}, {"store": "GS25", "expense": 1200}],
+        1.0,
+    ),
+    (
+        "금액과 같은 줄의 출금/입금 표시",
+        ["이마트", "출금 32,000원", "월급", "입금 2,000,000원"],
+        [{"store": "이마트", "expense": 32000}],
+        1.0,
+    ),
+    (
+        "금액 앞 줄에 따로 나온 출금/입금 표시",
+        ["CU편의점", "출금", "3,300원", "카카오페이", "입금", "10,000원"],
+        [{"store": "CU편의점", "expense": 3300}],
+        1.0,
+    ),
+    (
+        "잔액 표시 줄은 건너뜀",
+        ["스타벅스", "-4,500원", "잔액 95,500원", "GS25", "-1,200원"],
+        [{"store": "스타벅스", "expense": 4500}, {"store": "GS25", "expense": 1200}],
+        1.0,
+    ),
+    (
+        "거래 금액 바로 아래 부호 없는 금액은 잔액",
+        ["올리브영", "-12,000원", "83,500원"],
+        [{"store": "올리브영", "expense": 12000}],
+        1.0,
+    ),
+    (
+        "날짜/시간 줄은 가게명으로 보지 않음",
+        [
+            "2025.02.10 (월)", "14:32", "배달의민족", "-18,900원",
+            "02.11", "09:05:12", "버스", "-1,500원",
+        ],
+        [{"store": "배달의민족", "expense": 18900}, {"store": "버스", "expense": 1500}],
+        1.0,
+    ),
+    (
+        "입금만 있으면 결과 없음",
+        ["이자", "+120원"],
+        [],
+        0.0,
+    ),
+    (
+        "출금/입금 구분 없는 금액은 신뢰도 낮음",
+        ["편의점", "4,500원", "택시", "8,000원"],
+        [{"store": "편의점", "expense": 4500}, {"store": "택시", "expense": 8000}],
+        0.5,
+    ),
+    (
+        "가게명 없는 출금",
+        ["-4,500원"],
+        [],
+        0.0,
+    ),
+    (
+        "금액 없는 텍스트",
+        ["안녕하세요", "2025"],
+        [],
+        0.0,
+    ),
+]
+
+
+class ParseStatementTest(unittest.TestCase):
+    def test_layouts(self):
+        for description, texts, expected, confidence in CASES:
+            with self.subTest(description):
+                results, score = parse_statement(texts)
+                self.assertEqual(results, expected)
+                self.assertAlmostEqual(score, confidence)
+
+
+class RuleParserFallbackTest(unittest.TestCase):
+    """신뢰도가 기준 미만인 이미지만 OpenAI로 넘기는지 확인"""
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("OPENAI_API_KEY", "test")
+        import ocr_api
+        from result_cache import ResultCache
+
+        cls.ocr_api = ocr_api
+        cls.cache = mock.patch.object(
+            ocr_api, "result_cache", ResultCache(path=":memory:")
+        )
+        cls.cache.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.cache.stop()
+
+    def extract(self, texts_by_image):
+        ocr_api = self.ocr_api
+        images = {
+            f"image{index}".encode(): texts for index, texts in enumerate(texts_by_image)
+        }
+
+        async def extract_texts(contents):
+            return images[contents]
+
+        async def process_with_openai(texts):
+            return [ocr_api.OCRResult(store="LLM", expense=1)]
+
+        files = [mock.AsyncMock(filename=name.decode()) for name in images]
+        for file, name in zip(files, images):
+            file.read.return_value = name
+
+        llm = mock.AsyncMock(side_effect=process_with_openai)
+        with mock.patch.object(ocr_api, "extract_texts", extract_texts), mock.patch.object(
+            ocr_api, "process_with_openai", llm
+        ):
+            response = asyncio.run(ocr_api.extract_text(files))
+        return response.results, llm
+
+    def test_confident_image_skips_llm(self):
+        results, llm = self.extract([["스타벅스", "-4,500원"]])
+        llm.assert_not_called()
+        self.assertEqual([(r.store, r.expense) for r in results], [("스타벅스", 4500)])
+
+    def test_low_confidence_image_falls_back_to_llm(self):
+        ambiguous = ["편의점", "4,500원"]
+        results, llm = self.extract([["스타벅스", "-4,500원"], ambiguous])
+        llm.assert_called_once_with(ambiguous)
+        self.assertEqual(
+            [(r.store, r.expense) for r in results], [("스타벅스", 4500), ("LLM", 1)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()